@@ -8,23 +8,229 @@ CustomTkinter interface for mathematical function analysis and visualization.
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-import matplotlib.pyplot as plt
-import matplotlib.backends.backend_tkagg as tkagg
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-import numpy as np
-import sympy as sp
 import re
-from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+import logging
 import sys
 import os
+import threading
 
 # Add the project root to the path to import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from Models.main_function import MainFunctionProcessor
-from Interface.show_info import ShowInfoFrame
-from Utils.math_utils import evaluate_expression, is_real_number
+# SymPy's cache (diff, subs, ...) holds 1000 entries by default, too few for an
+# interactive session over large derivatives. Only read when SymPy is first
+# imported, so it is set here, before any import of it; the environment wins.
+os.environ.setdefault('SYMPY_CACHE_SIZE', '10000')
+
+# Errors are logged, not printed; applications decide where they go
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Identifiers in a function string; see _load_numeric_stack for the exclusions
+_IDENT_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z_0-9]*)\b')
+_EXCLUDED_NAMES = frozenset()
+
+# Operation count from which lambdify factors out common subexpressions;
+# below it the CSE pass costs more than it saves
+_CSE_MIN_OPS = 10
+
+# Curve samples larger than this (in magnitude) are not drawn
+_SPIKE_MAGNITUDE = 1e4
+
+# Whether main() has already applied the CustomTkinter appearance mode and theme
+_THEME_SET = False
+
+# Legend entry (Line2D proxy style) for each plotted category, in legend order
+_LEGEND_STYLES = {
+    'function': dict(color='cyan', linewidth=2, label='f(x)'),
+    'critical': dict(marker='^', color='red', linestyle='None', markersize=10, label='Puntos críticos'),
+    'inflection': dict(marker='o', color='orange', linestyle='None', markersize=8, label='Puntos de inflexión'),
+    'x_intercepts': dict(marker='s', color='blue', linestyle='None', markersize=8, label='Interceptos X'),
+    'y_intercept': dict(marker='D', color='purple', linestyle='None', markersize=8, label='Intercepto Y'),
+    'vertical': dict(color='red', linestyle='--', alpha=0.7, linewidth=1, label='Asíntotas verticales'),
+    'horizontal': dict(color='green', linestyle='--', alpha=0.7, linewidth=1, label='Asíntotas horizontales'),
+    'oblique': dict(color='yellow', linestyle='--', alpha=0.7, linewidth=1, label='Asíntotas oblicuas'),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_numeric_stack():
+    """
+    Import NumPy, SymPy, Matplotlib and the analysis modules on first use.
+    
+    These libraries take over a second to import, so the window is shown
+    first and the import cost is paid on the first "Inicializar" click.
+    """
+    global np, sp, mpl_style, Figure, Line2D, FigureCanvasTkAgg, NavigationToolbar2Tk
+    global MainFunctionProcessor, show_analysis_results, is_real_number, cached_sympify, horner_form
+    global _EXCLUDED_NAMES, numba
+    
+    import numpy as np
+    import sympy as sp
+    
+    # Numba is optional; without it the plot uses the plain NumPy evaluator
+    try:
+        import numba
+    except ImportError:
+        numba = None
+    from matplotlib import style as mpl_style
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+    
+    from Models.main_function import MainFunctionProcessor
+    from Interface.show_info import show_analysis_results
+    from Utils.math_utils import is_real_number, cached_sympify, horner_form
+    
+    # Names that are not parameters: the variable, common constants/aliases
+    # and every name sympify resolves itself
+    _EXCLUDED_NAMES = frozenset({'x', 'e', 'pi', 'I', 'E', 'ln', 'abs'}) | frozenset(
+        name for name in vars(sp) if not name.startswith('_')
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_function(func_str: str, parameters: Tuple[str, ...]):
+    """
+    Compile the function string into a vectorized NumPy callable.
+    
+    The result depends only on the function structure, so it is cached by
+    function string and parameter names and reused across parameter changes.
+    Larger expressions are generated with common subexpression elimination,
+    so repeated terms are evaluated once per sample.
+    
+    When Numba is installed the function is compiled into a parallel ufunc;
+    otherwise, or if Numba cannot compile it, the NumPy lambdify is used.
+    
+    Args:
+        func_str: String representation of the mathematical function
+        parameters: Ordered parameter names, passed positionally after x
+        
+    Returns:
+        Callable taking (x, *parameter_values), or None if compilation fails
+    """
+    try:
+        expr = cached_sympify(func_str)
+    except Exception as e:
+        logger.warning("Error compiling function: %s", e)
+        return None
+    
+    return _compile_expression(expr, parameters)
+
+
+@lru_cache(maxsize=64)
+def _compile_expression(expr: Any, parameters: Tuple[str, ...]):
+    """
+    Compile a parsed expression into a vectorized callable.
+    
+    Cached by the expression tree itself, so differently written strings
+    that parse to the same expression ("2*x" and "x*2") share one compiled
+    callable, and the Numba compilation runs once for both.
+    
+    Args:
+        expr: Parsed SymPy expression
+        parameters: Ordered parameter names, passed positionally after x
+        
+    Returns:
+        Callable taking (x, *parameter_values), or None if compilation fails
+    """
+    try:
+        symbols = [sp.Symbol('x')] + [sp.Symbol(p) for p in parameters]
+        # Polynomials and rational functions evaluate in nested form
+        expr = horner_form(expr, symbols[0])
+        cse = sp.count_ops(expr) >= _CSE_MIN_OPS
+        f_np = sp.lambdify(symbols, expr, modules=["numpy"], cse=cse)
+    except Exception as e:
+        logger.warning("Error compiling function: %s", e)
+        return None
+    
+    return _compile_numba_ufunc(symbols, expr, cse) or f_np
+
+
+def _compile_numba_ufunc(symbols: List[Any], expr: Any, cse: bool = False):
+    """
+    Compile an expression into a float64 Numba ufunc evaluated on all cores.
+    
+    The scalar kernel is a lambdify over the math module, which Numba compiles
+    in nopython mode. Ufunc kernels use NumPy's error model, so division by
+    zero and out-of-domain math yield inf/NaN just like the NumPy evaluator.
+    
+    Args:
+        symbols: The variable x followed by the parameter symbols
+        expr: Parsed SymPy expression
+        cse: Whether the kernel computes common subexpressions once
+        
+    Returns:
+        Callable taking (x, *parameter_values), or None if Numba is missing or cannot compile expr
+    """
+    if numba is None:
+        return None
+    try:
+        kernel = sp.lambdify(symbols, expr, modules="math", cse=cse)
+        signature = numba.float64(*[numba.float64] * len(symbols))
+        return numba.vectorize([signature], target='parallel')(kernel)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _x_grid(x_min: float, x_max: float, num: int) -> "np.ndarray":
+    """
+    Return a shared, read-only sample grid for the given plot range.
+    
+    Parameter-only changes keep the same range, so redraws reuse the grid
+    instead of allocating a new array every time. The grid only feeds the
+    display, so it is float32 like Agg's own path data; analysis stays float64.
+    """
+    x_vals = np.linspace(x_min, x_max, num, dtype=np.float32)
+    x_vals.flags.writeable = False
+    return x_vals
+
+
+def _drawable_curve(y_vals: "np.ndarray") -> "np.ndarray":
+    """
+    Return a copy of the curve samples with NaN wherever the line must break.
+    
+    Samples beyond _SPIKE_MAGNITUDE are dropped, and so is the larger of two
+    neighbouring samples that change sign while both grow in magnitude
+    towards each other: that is an odd pole (1/x, tan(x)) between them,
+    which a continuous zero crossing never looks like. Matplotlib breaks
+    lines at NaN, so the branches on either side are not joined.
+    """
+    y = np.where(np.abs(y_vals) > _SPIKE_MAGNITUDE, np.nan, y_vals)
+    if y.size < 2:
+        return y
+    
+    with np.errstate(invalid='ignore'):
+        magnitude = np.nan_to_num(np.abs(y), nan=0.0)
+        before = np.concatenate(([0.0], magnitude[:-2]))
+        after = np.concatenate((magnitude[2:], [0.0]))
+        lo, hi = y[:-1], y[1:]
+        pole = (lo * hi < 0) & (magnitude[:-1] >= before) & (magnitude[1:] >= after)
+    
+    index = np.flatnonzero(pole)
+    y[np.where(magnitude[index] >= magnitude[index + 1], index, index + 1)] = np.nan
+    return y
+
+
+@lru_cache(maxsize=128)
+def _compile_oblique_asymptote(asymptote: Any):
+    """
+    Compile an oblique asymptote string like "y = 2.0*x + 1.0" into a NumPy callable.
+    
+    Returns:
+        Callable of x, or None if the asymptote cannot be parsed
+    """
+    if not isinstance(asymptote, str) or asymptote.count('=') != 1:
+        return None
+    try:
+        expr = sp.sympify(asymptote.split('=')[1].strip())
+        return sp.lambdify(sp.Symbol('x'), expr, modules=["numpy"])
+    except Exception:
+        return None
 
 
 class App(ctk.CTk):
@@ -33,8 +239,21 @@ class App(ctk.CTk):
     
     This class provides a comprehensive interface for mathematical function
     analysis including input, parameter adjustment, visualization, and detailed analysis.
+    
+    Plotting uses the object-oriented Matplotlib API only: the single Figure and
+    canvas created in _create_plot_canvas live as long as the app. Never create
+    figures through pyplot here, since pyplot keeps global references to them.
     """
     
+    # Delay used to coalesce bursts of parameter changes into one update
+    UPDATE_DELAY_MS = 30
+    
+    # Number of samples used to draw the function curve
+    PLOT_SAMPLES = 1000
+    
+    # View heights beyond the y-limits past which curve samples are not drawn
+    SPIKE_VIEW_SPANS = 10
+    
     def __init__(self):
         """Initialize the main application."""
         super().__init__()
@@ -44,10 +263,6 @@ class App(ctk.CTk):
         self.geometry("1400x900")
         self.resizable(True, True)
         
-        # Set appearance mode and color theme
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
-        
         # Configure grid weights
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -56,14 +271,23 @@ class App(ctk.CTk):
         self.current_function = ""
         self.current_parameters = {}
         self.parameter_controls = {}
+        self._no_params_label = None
         self.analysis_results = None
-        self.processor = None
+        self._f_np = None
+        self._param_order = []
+        self._line = None
+        self._x_vals = None
+        self._y_buf = None
+        self._markers = {}
+        self._asymptote_lines = {}
+        self._legend_categories = None
+        self._bg = None
+        self._pending_redraw = None
+        self._batch_depth = 0
+        self._batch_dirty = False
         
-        # Create the interface
+        # Create the interface (the plot canvas is created on first use)
         self._create_interface()
-        
-        # Initialize matplotlib
-        plt.style.use('dark_background')
     
     def _create_interface(self):
         """Create the main interface layout."""
@@ -148,12 +372,19 @@ class App(ctk.CTk):
         self.left_frame.grid_columnconfigure(0, weight=1)
     
     def _create_right_panel(self):
-        """Create the right panel with matplotlib canvas."""
+        """Create the right panel that will hold the matplotlib canvas."""
         # Right frame
         self.right_frame = ctk.CTkFrame(self, corner_radius=0)
         self.right_frame.grid(row=0, column=1, sticky="nsew", padx=(5, 10), pady=10)
         self.right_frame.grid_rowconfigure(0, weight=1)
         self.right_frame.grid_columnconfigure(0, weight=1)
+        self.canvas = None
+    
+    def _create_plot_canvas(self):
+        """Create the matplotlib figure, canvas and toolbar in the right panel."""
+        # Initialize matplotlib (rcParams only, no pyplot state) before the
+        # axes exist, since they are never cleared and re-styled afterwards
+        mpl_style.use('dark_background')
         
         # Create matplotlib figure and canvas
         self.fig = Figure(figsize=(10, 8), dpi=100, facecolor='#212121')
@@ -165,9 +396,13 @@ class App(ctk.CTk):
         self.ax.set_ylabel('f(x)', color='white', fontsize=12)
         self.ax.tick_params(colors='white')
         
+        # Create the artists once; redraws only update their data
+        self._create_plot_artists()
+        
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, self.right_frame)
-        self.canvas.draw()
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
         
         # Add navigation toolbar
@@ -177,107 +412,148 @@ class App(ctk.CTk):
         self.toolbar = NavigationToolbar2Tk(self.canvas, self.toolbar_frame)
         self.toolbar.config(bg='#212121')
         self.toolbar.update()
+        
+        # Buffer reused for the curve values on every redraw
+        self._y_buf = np.empty(self.PLOT_SAMPLES, dtype=np.float32)
+    
+    def _create_plot_artists(self):
+        """Create the empty curve, marker and asymptote artists on the axes."""
+        self._line, = self.ax.plot([], [], 'cyan', linewidth=2)
+        
+        self._markers = {
+            'critical': self.ax.scatter([], [], marker='^', c='red', s=100, zorder=3),
+            'inflection': self.ax.scatter([], [], marker='o', c='orange', s=64, zorder=3),
+            'x_intercepts': self.ax.scatter([], [], marker='s', c='blue', s=64, zorder=3),
+            'y_intercept': self.ax.scatter([], [], marker='D', c='purple', s=64, zorder=3),
+        }
+        
+        # Each asymptote kind is one line; NaN separates its segments. Vertical
+        # and horizontal lines span the axes through blended transforms.
+        self._asymptote_lines = {
+            'vertical': self.ax.plot([], [], color='red', linestyle='--', alpha=0.7, linewidth=1,
+                                     transform=self.ax.get_xaxis_transform())[0],
+            'horizontal': self.ax.plot([], [], color='green', linestyle='--', alpha=0.7, linewidth=1,
+                                       transform=self.ax.get_yaxis_transform())[0],
+            'oblique': self.ax.plot([], [], '--', color='yellow', alpha=0.7, linewidth=1)[0],
+        }
     
     def _extract_parameters(self, func_str: str) -> List[str]:
         """Extract parameter names from function string."""
-        try:
-            # Parse with sympy to get symbols
-            expr = sp.sympify(func_str)
-            symbols = expr.free_symbols
-            
-            # Filter out 'x' and common functions
-            parameters = []
-            excluded = {'x', 'e', 'pi', 'I', 'E', 'sin', 'cos', 'tan', 'log', 'ln', 'exp', 'sqrt'}
-            
-            for symbol in symbols:
-                symbol_str = str(symbol)
-                if symbol_str not in excluded and symbol_str.isalpha():
-                    parameters.append(symbol_str)
-            
-            return sorted(parameters)
-        except Exception:
-            return []
+        # A regex scan is enough to find free identifiers; no SymPy parse needed
+        return sorted({
+            name for name in _IDENT_RE.findall(func_str)
+            if name not in _EXCLUDED_NAMES and name.isalpha()
+        })
     
     def _create_parameter_controls(self, parameters: List[str]):
-        """Create slider and entry controls for parameters."""
-        # Clear existing controls
-        for widget in self.params_frame.winfo_children():
-            widget.destroy()
+        """
+        Create slider and entry controls for parameters.
         
-        self.parameter_controls = {}
+        Rows for parameters that survive a function change are reused (keeping
+        their current values); only added or removed parameters create or
+        destroy widgets.
+        """
+        old_params = set(self.parameter_controls)
+        new_params = set(parameters)
+        
+        # Remove rows (and values) of parameters that no longer exist
+        for param in old_params - new_params:
+            self.parameter_controls.pop(param)['frame'].destroy()
+            self.current_parameters.pop(param, None)
         
         if not parameters:
-            no_params_label = ctk.CTkLabel(
-                self.params_frame,
-                text="Esta función no tiene parámetros",
-                font=ctk.CTkFont(size=12),
-                text_color=("gray60", "gray40")
-            )
-            no_params_label.grid(row=0, column=0, padx=20, pady=20)
+            if self._no_params_label is None:
+                self._no_params_label = ctk.CTkLabel(
+                    self.params_frame,
+                    text="Esta función no tiene parámetros",
+                    font=ctk.CTkFont(size=12),
+                    text_color=("gray60", "gray40")
+                )
+                self._no_params_label.grid(row=0, column=0, padx=20, pady=20)
             return
         
+        if self._no_params_label is not None:
+            self._no_params_label.destroy()
+            self._no_params_label = None
+        
+        for param in parameters:
+            if param not in self.parameter_controls:
+                self._create_parameter_row(param)
+        
+        # Reorder the rows without rebuilding them
         for i, param in enumerate(parameters):
-            # Parameter label
-            param_label = ctk.CTkLabel(
-                self.params_frame,
-                text=f"Parámetro {param}:",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            param_label.grid(row=i*3, column=0, padx=10, pady=(10, 5), sticky="w")
-            
-            # Value frame
-            value_frame = ctk.CTkFrame(self.params_frame)
-            value_frame.grid(row=i*3+1, column=0, padx=10, pady=5, sticky="ew")
-            value_frame.grid_columnconfigure(1, weight=1)
-            
-            # Entry for exact value
-            entry = ctk.CTkEntry(
-                value_frame,
-                width=80,
-                height=30,
-                font=ctk.CTkFont(size=12)
-            )
-            entry.grid(row=0, column=0, padx=(5, 10), pady=5)
-            entry.insert(0, "1.0")
-            
-            # Slider for interactive adjustment
-            slider = ctk.CTkSlider(
-                value_frame,
-                from_=-10,
-                to=10,
-                number_of_steps=200,
-                height=20
-            )
-            slider.grid(row=0, column=1, padx=(0, 5), pady=5, sticky="ew")
-            slider.set(1.0)
-            
-            # Value display label
-            value_label = ctk.CTkLabel(
-                value_frame,
-                text="1.00",
-                width=60,
-                font=ctk.CTkFont(size=12)
-            )
-            value_label.grid(row=0, column=2, padx=5, pady=5)
-            
-            # Store controls
-            self.parameter_controls[param] = {
-                'entry': entry,
-                'slider': slider,
-                'label': value_label
-            }
-            
-            # Bind events
-            slider.configure(command=lambda value, p=param: self._on_slider_change(p, value))
-            entry.bind("<Return>", lambda event, p=param: self._on_entry_change(p))
-            entry.bind("<FocusOut>", lambda event, p=param: self._on_entry_change(p))
-            
-            # Initialize parameter value
-            self.current_parameters[param] = 1.0
+            self.parameter_controls[param]['frame'].grid_configure(row=i)
         
         # Configure grid weights
         self.params_frame.grid_columnconfigure(0, weight=1)
     
+    def _create_parameter_row(self, param: str):
+        """Create the label, entry, slider and value display for one parameter."""
+        # Row container
+        row_frame = ctk.CTkFrame(self.params_frame, fg_color="transparent")
+        row_frame.grid(column=0, sticky="ew")
+        row_frame.grid_columnconfigure(0, weight=1)
+        
+        # Parameter label
+        param_label = ctk.CTkLabel(
+            row_frame,
+            text=f"Parámetro {param}:",
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        param_label.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        
+        # Value frame
+        value_frame = ctk.CTkFrame(row_frame)
+        value_frame.grid(row=1, column=0, padx=10, pady=5, sticky="ew")
+        value_frame.grid_columnconfigure(1, weight=1)
+        
+        # Entry for exact value
+        entry = ctk.CTkEntry(
+            value_frame,
+            width=80,
+            height=30,
+            font=ctk.CTkFont(size=12)
+        )
+        entry.grid(row=0, column=0, padx=(5, 10), pady=5)
+        entry.insert(0, "1.0")
+        
+        # Slider for interactive adjustment
+        slider = ctk.CTkSlider(
+            value_frame,
+            from_=-10,
+            to=10,
+            number_of_steps=200,
+            height=20
+        )
+        slider.grid(row=0, column=1, padx=(0, 5), pady=5, sticky="ew")
+        slider.set(1.0)
+        
+        # Value display label
+        value_label = ctk.CTkLabel(
+            value_frame,
+            text="1.00",
+            width=60,
+            font=ctk.CTkFont(size=12)
+        )
+        value_label.grid(row=0, column=2, padx=5, pady=5)
+        
+        # Store controls
+        self.parameter_controls[param] = {
+            'frame': row_frame,
+            'entry': entry,
+            'slider': slider,
+            'label': value_label
+        }
+        
+        # Bind events
+        slider.configure(command=lambda value, p=param: self._on_slider_change(p, value))
+        slider.bind("<ButtonRelease-1>", lambda event: self._schedule_update(self._update_plot))
+        entry.bind("<Return>", lambda event, p=param: self._on_entry_change(p))
+        entry.bind("<FocusOut>", lambda event, p=param: self._on_entry_change(p))
+        
+        # Initialize parameter value
+        self.current_parameters[param] = 1.0
+    
     def _on_slider_change(self, param: str, value: float):
         """Handle slider value change."""
         # Update entry and label
@@ -289,8 +565,66 @@ class App(ctk.CTk):
         # Update parameter value
         self.current_parameters[param] = value
         
-        # Redraw plot
-        self._update_plot()
+        # Repaint only the curve while dragging; the full analysis runs on release
+        self._schedule_update(self._fast_update_plot)
+    
+    def _schedule_update(self, callback):
+        """
+        Defer a plot update, cancelling any update still pending.
+        
+        Only the last change in a burst of slider or entry events triggers work.
+        Inside a _batch() block the update is deferred until the block exits.
+        """
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        if self._pending_redraw is not None:
+            self.after_cancel(self._pending_redraw)
+        self._pending_redraw = self.after(self.UPDATE_DELAY_MS, self._run_pending_update, callback)
+    
+    @contextmanager
+    def _batch(self):
+        """
+        Group several parameter changes into a single plot update.
+        
+        Blocks may be nested; the plot is updated once, when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._update_plot()
+    
+    def set_parameters(self, values: Dict[str, float]):
+        """
+        Set several parameter values at once and redraw the plot a single time.
+        
+        Args:
+            values: Dictionary of parameter names and values; unknown names are ignored
+        """
+        with self._batch():
+            for param, value in values.items():
+                if param not in self.parameter_controls:
+                    continue
+                controls = self.parameter_controls[param]
+                controls['entry'].delete(0, tk.END)
+                controls['entry'].insert(0, f"{value:.2f}")
+                self._on_entry_change(param)
+    
+    def _run_pending_update(self, callback):
+        """
+        Run a deferred update scheduled by _schedule_update.
+        
+        Callbacks run from the Tk event loop and never pump it themselves: do
+        not call self.update() here or in the plot methods. Handling events in
+        the middle of a redraw re-enters the slider handlers and draws frames
+        for values that are already stale; draw_idle and after() are enough.
+        """
+        self._pending_redraw = None
+        callback()
     
     def _on_entry_change(self, param: str):
         """Handle entry value change."""
@@ -309,7 +643,7 @@ class App(ctk.CTk):
             self.current_parameters[param] = value
             
             # Redraw plot
-            self._update_plot()
+            self._schedule_update(self._update_plot)
             
         except ValueError:
             # Reset to current value
@@ -326,9 +660,16 @@ class App(ctk.CTk):
             return
         
         try:
-            # Update status
+            # Update status. Only flush idle tasks so the label repaints; a full
+            # update() would also process queued input and could re-enter this
+            # callback. Work that must wait for a repaint belongs in after(0, ...).
             self.status_label.configure(text="Analizando función...")
-            self.update()
+            self.update_idletasks()
+            
+            # Load the numeric stack and plot canvas on first use
+            _load_numeric_stack()
+            if self.canvas is None:
+                self._create_plot_canvas()
             
             # Store current function
             self.current_function = func_str
@@ -339,11 +680,12 @@ class App(ctk.CTk):
             # Create parameter controls
             self._create_parameter_controls(parameters)
             
-            # Initialize processor
-            self.processor = MainFunctionProcessor(func_str, self.current_parameters)
+            # Compile a vectorized evaluator for plotting
+            self._param_order = parameters
+            self._f_np = _compile_function(func_str, tuple(parameters))
             
-            # Perform analysis
-            self.analysis_results = self.processor.analyze_function()
+            # Perform analysis (cached by function and parameter values)
+            self.analysis_results = self._run_analysis()
             
             # Check for analysis errors
             if 'error' in self.analysis_results:
@@ -363,65 +705,69 @@ class App(ctk.CTk):
             self._show_error(f"Error al procesar la función: {str(e)}")
             self.status_label.configure(text="Error en el análisis")
     
+    def _run_analysis(self) -> Dict[str, Any]:
+        """
+        Analyze the current function with the current parameter values.
+        
+        MainFunctionProcessor caches results per function and parameter values
+        and hands out a copy, and the derivatives are computed once per
+        function and only have the parameter values substituted.
+        """
+        return MainFunctionProcessor(self.current_function, dict(self.current_parameters)).analyze_function()
+    
     def _update_plot(self):
         """Update plot with current parameters."""
         if not self.current_function:
             return
         
         try:
-            # Update processor with new parameters
-            self.processor = MainFunctionProcessor(self.current_function, self.current_parameters)
-            self.analysis_results = self.processor.analyze_function()
+            # Re-analyze with new parameters (cached by parameter values)
+            self.analysis_results = self._run_analysis()
             
             # Plot function
             self._plot_function()
             
         except Exception as e:
-            print(f"Error updating plot: {e}")
+            logger.warning("Error updating plot: %s", e)
     
     def _plot_function(self):
         """Plot the function with analysis results."""
         if not self.analysis_results:
             return
         
-        # Clear previous plot
-        self.ax.clear()
-        
-        # Configure plot appearance
-        self.ax.grid(True, alpha=0.3, color='white')
-        self.ax.set_xlabel('x', color='white', fontsize=12)
-        self.ax.set_ylabel('f(x)', color='white', fontsize=12)
-        self.ax.tick_params(colors='white')
-        self.ax.set_facecolor('#2b2b2b')
-        
         # Determine plot range
         x_range = self._get_plot_range()
-        x_vals = np.linspace(x_range[0], x_range[1], 1000)
+        x_vals = _x_grid(round(x_range[0], 6), round(x_range[1], 6), self.PLOT_SAMPLES)
+        self._x_vals = x_vals
         
-        # Calculate function values
-        y_vals = []
-        for x in x_vals:
-            value = evaluate_expression(self.current_function, x, self.current_parameters)
-            y_vals.append(value if value is not None else np.nan)
+        # Calculate function values in a single vectorized pass, broken at poles
+        y_vals = _drawable_curve(self._evaluate_on_grid(x_vals))
         
-        y_vals = np.array(y_vals)
+        # Set reasonable y-limits first; the curve is cut against them
+        self._set_plot_limits(y_vals)
         
-        # Plot main function
-        valid_mask = ~np.isnan(y_vals) & np.isfinite(y_vals)
-        if np.any(valid_mask):
-            self.ax.plot(x_vals[valid_mask], y_vals[valid_mask], 'cyan', linewidth=2, label='f(x)')
+        # Update main function (a full draw includes the curve again)
+        self._set_curve_data(x_vals, y_vals)
+        self._line.set_animated(False)
+        self._bg = None
         
-        # Plot analysis markers
-        self._plot_analysis_markers()
+        # Update analysis markers
+        marker_categories = self._plot_analysis_markers()
         
-        # Plot asymptotes
-        self._plot_asymptotes(x_range)
+        # Update asymptotes
+        asymptote_categories = self._plot_asymptotes(x_range)
         
-        # Set reasonable y-limits
-        self._set_plot_limits(y_vals)
+        # Fit the x-axis to the curve
+        self.ax.relim()
+        self.ax.autoscale_view(scaley=False)
         
-        # Add legend
-        self.ax.legend(loc='upper right', facecolor='#2b2b2b', edgecolor='white', labelcolor='white')
+        # Add legend, one proxy entry per plotted category; rebuilt only when the categories change
+        categories = ('function', *marker_categories, *asymptote_categories)
+        if categories != self._legend_categories:
+            proxies = [Line2D([0], [0], **_LEGEND_STYLES[category]) for category in categories]
+            self.ax.legend(handles=proxies, loc='upper right', facecolor='#2b2b2b',
+                           edgecolor='white', labelcolor='white')
+            self._legend_categories = categories
         
         # Set title
         title = f"f(x) = {self.current_function}"
@@ -431,7 +777,92 @@ class App(ctk.CTk):
         self.ax.set_title(title, color='white', fontsize=14, pad=20)
         
         # Refresh canvas
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def _fast_update_plot(self):
+        """
+        Repaint only the function curve using blitting.
+        
+        The axes background (grid, ticks, markers) is rendered once with the
+        curve marked as animated and reused for every subsequent repaint, so
+        slider drags do not redraw the whole figure.
+        """
+        # Stale values never get here: _schedule_update cancels a pending
+        # repaint when a newer value arrives, so only the newest is painted
+        if self._x_vals is None:
+            return
+        
+        y_vals = _drawable_curve(self._evaluate_on_grid(self._x_vals))
+        self._set_curve_data(self._x_vals, y_vals)
+        
+        if not self._line.get_animated():
+            # Render the background without the curve; _on_canvas_draw blits it back
+            self._line.set_animated(True)
+            self.canvas.draw()
+            return
+        
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._line)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _set_curve_data(self, x_vals: "np.ndarray", y_vals: "np.ndarray"):
+        """
+        Give the curve its samples, breaking it where it cannot be drawn.
+        
+        Non-finite samples and samples more than SPIKE_VIEW_SPANS view heights
+        beyond the current y-limits become NaN, so the line stops at vertical
+        asymptotes instead of joining the branches with a huge clipped segment.
+        The y-limits come from the samples themselves on a full redraw, so this
+        only cuts anything during slider drags; poles are broken beforehand
+        by _drawable_curve. The values are copied, since y_vals may be the
+        reused evaluation buffer.
+        """
+        y_low, y_high = self.ax.get_ylim()
+        margin = (y_high - y_low) * self.SPIKE_VIEW_SPANS
+        with np.errstate(invalid='ignore'):
+            drawable = (y_vals >= y_low - margin) & (y_vals <= y_high + margin)
+        self._line.set_data(x_vals, np.where(drawable, y_vals, np.nan))
+    
+    def _on_canvas_draw(self, event):
+        """Capture the blitting background after every full canvas draw."""
+        if self._line is None or not self._line.get_animated():
+            return
+        
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._line)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _evaluate_on_grid(self, x_vals: "np.ndarray") -> "np.ndarray":
+        """
+        Evaluate the compiled function over a whole array of x values.
+        
+        Points where the function is undefined or complex are returned as NaN.
+        Results for the plot grid are written into a preallocated float32
+        buffer that is overwritten by the next call, so callers must not keep
+        a reference.
+        """
+        if self._f_np is None:
+            return np.full(x_vals.shape, np.nan, dtype=np.float32)
+        
+        param_values = [self.current_parameters.get(p, 1.0) for p in self._param_order]
+        try:
+            with np.errstate(all='ignore'):
+                # Compiled ufuncs write straight into the buffer, without a temporary
+                if isinstance(self._f_np, np.ufunc) and x_vals.shape == self._y_buf.shape:
+                    return self._f_np(x_vals, *param_values, out=self._y_buf)
+                y_vals = np.asarray(self._f_np(x_vals, *param_values))
+                if np.iscomplexobj(y_vals):
+                    y_vals = np.where(y_vals.imag == 0, y_vals.real, np.nan)
+                if x_vals.shape == self._y_buf.shape:
+                    np.copyto(self._y_buf, y_vals)
+                    return self._y_buf
+                return np.broadcast_to(y_vals, x_vals.shape).astype(np.float32)
+        except Exception:
+            return np.full(x_vals.shape, np.nan, dtype=np.float32)
     
     def _get_plot_range(self) -> tuple:
         """Determine appropriate plot range."""
@@ -440,119 +871,142 @@ class App(ctk.CTk):
         
         # Adjust based on critical points and intercepts
         if self.analysis_results:
-            points = []
-            
-            # Add critical points
-            critical_points = self.analysis_results.get('critical_points', [])
-            points.extend(critical_points)
-            
-            # Add x-intercepts
             intercepts = self.analysis_results.get('intercepts', {})
-            x_intercepts = intercepts.get('x_intercepts', [])
-            points.extend(x_intercepts)
+            if not isinstance(intercepts, dict):
+                intercepts = {}
+            points_array = np.concatenate([
+                self._as_float_array(self.analysis_results.get('critical_points', [])),
+                self._as_float_array(intercepts.get('x_intercepts', [])),
+                self._as_float_array(self.analysis_results.get('inflection_points', [])),
+            ])
+            points_array = points_array[np.isfinite(points_array)]
             
-            # Add inflection points
-            inflection_points = self.analysis_results.get('inflection_points', [])
-            points.extend(inflection_points)
-            
-            if points:
-                points_array = np.array([p for p in points if is_real_number(p)])
-                if len(points_array) > 0:
-                    range_padding = max(2, (np.max(points_array) - np.min(points_array)) * 0.2)
-                    x_min = min(x_min, np.min(points_array) - range_padding)
-                    x_max = max(x_max, np.max(points_array) + range_padding)
+            if points_array.size > 0:
+                points_min, points_max = points_array.min(), points_array.max()
+                range_padding = max(2, (points_max - points_min) * 0.2)
+                x_min = min(x_min, points_min - range_padding)
+                x_max = max(x_max, points_max + range_padding)
         
         return (x_min, x_max)
     
-    def _plot_analysis_markers(self):
-        """Plot markers for critical points, intercepts, etc."""
-        if not self.analysis_results:
-            return
+    @staticmethod
+    def _as_float_array(values: Any) -> "np.ndarray":
+        """
+        Convert a list of analysis points to a float array.
         
-        # Critical points (need to classify as max/min)
-        critical_points = self.analysis_results.get('critical_points', [])
-        critical_values = self.analysis_results.get('critical_points_values', {})
-        
-        for cp in critical_points:
-            if str(cp) in critical_values:
-                y_val = critical_values[str(cp)]
-                if y_val is not None:
-                    # Simple classification: use second derivative test
-                    # For now, use triangles (can be enhanced)
-                    self.ax.plot(cp, y_val, '^', color='red', markersize=10, 
-                                label='Puntos críticos' if cp == critical_points[0] else "")
-        
-        # Inflection points
-        inflection_points = self.analysis_results.get('inflection_points', [])
-        inflection_values = self.analysis_results.get('inflection_points_values', {})
-        
-        for ip in inflection_points:
-            if str(ip) in inflection_values:
-                y_val = inflection_values[str(ip)]
-                if y_val is not None:
-                    self.ax.plot(ip, y_val, 'o', color='orange', markersize=8,
-                                label='Puntos de inflexión' if ip == inflection_points[0] else "")
-        
-        # X-intercepts
-        intercepts = self.analysis_results.get('intercepts', {})
-        x_intercepts = intercepts.get('x_intercepts', [])
+        Args:
+            values: Analysis result, normally a list of floats (an error dict when analysis failed)
+            
+        Returns:
+            1-D float array, empty if the values are missing or not numeric
+        """
+        if not isinstance(values, (list, tuple)) or not values:
+            return np.empty(0)
+        try:
+            return np.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            return np.array([float(v) for v in values if is_real_number(v)])
+    
+    def _collect_marker_points(self, points_key: str, values_key: str) -> tuple:
+        """
+        Gather the plottable (x, f(x)) pairs of an analysis point list.
         
-        for xi in x_intercepts:
-            self.ax.plot(xi, 0, 's', color='blue', markersize=8,
-                        label='Interceptos X' if xi == x_intercepts[0] else "")
+        Returns:
+            Tuple of NumPy arrays (xs, ys), skipping points without a real value
+        """
+        points = self.analysis_results.get(points_key, [])
+        values = self.analysis_results.get(values_key, {})
+        if not isinstance(points, list) or not isinstance(values, dict):
+            return np.empty(0), np.empty(0)
         
-        # Y-intercept
+        pairs = [(p, values[str(p)]) for p in points
+                 if is_real_number(p) and is_real_number(values.get(str(p)))]
+        if not pairs:
+            return np.empty(0), np.empty(0)
+        xs, ys = np.asarray(pairs, dtype=float).T
+        return xs, ys
+    
+    def _plot_analysis_markers(self) -> List[str]:
+        """
+        Update markers for critical points, intercepts, etc.
+        
+        Returns:
+            Legend categories of the marker kinds that have points
+        """
+        intercepts = self.analysis_results.get('intercepts', {})
+        x_intercepts = np.asarray(
+            [xi for xi in intercepts.get('x_intercepts', []) if is_real_number(xi)], dtype=float)
         y_intercept = intercepts.get('y_intercept')
-        if y_intercept is not None:
-            self.ax.plot(0, y_intercept, 'D', color='purple', markersize=8, label='Intercepto Y')
+        
+        # Critical points (need to classify as max/min)
+        # For now, use triangles (can be enhanced with the second derivative test)
+        points = {
+            'critical': self._collect_marker_points('critical_points', 'critical_points_values'),
+            'inflection': self._collect_marker_points('inflection_points', 'inflection_points_values'),
+            'x_intercepts': (x_intercepts, np.zeros_like(x_intercepts)),
+            'y_intercept': (np.zeros(1), np.array([y_intercept], dtype=float))
+                           if y_intercept is not None else (np.empty(0), np.empty(0)),
+        }
+        
+        categories = []
+        for category, (xs, ys) in points.items():
+            self._markers[category].set_offsets(np.column_stack((xs, ys)))
+            if xs.size:
+                categories.append(category)
+        return categories
     
-    def _plot_asymptotes(self, x_range: tuple):
-        """Plot asymptotes."""
-        if not self.analysis_results:
-            return
+    def _plot_asymptotes(self, x_range: tuple) -> List[str]:
+        """
+        Update asymptote lines.
         
+        Returns:
+            Legend categories of the asymptote kinds that were drawn
+        """
         asymptotes = self.analysis_results.get('asymptotes', {})
+        if not isinstance(asymptotes, dict):
+            asymptotes = {}
         
-        # Vertical asymptotes
-        vertical = asymptotes.get('vertical', [])
-        for va in vertical:
-            self.ax.axvline(x=va, color='red', linestyle='--', alpha=0.7, linewidth=1,
-                          label='Asíntotas verticales' if va == vertical[0] else "")
+        # Vertical and horizontal asymptotes span the axes: (value, 0) -> (value, 1)
+        vertical = np.asarray(asymptotes.get('vertical', []), dtype=float)
+        self._asymptote_lines['vertical'].set_data(*self._axis_spanning_segments(vertical))
         
-        # Horizontal asymptotes
-        horizontal = asymptotes.get('horizontal', [])
-        for ha in horizontal:
-            self.ax.axhline(y=ha, color='green', linestyle='--', alpha=0.7, linewidth=1,
-                          label='Asíntotas horizontales' if ha == horizontal[0] else "")
+        horizontal = np.asarray(asymptotes.get('horizontal', []), dtype=float)
+        self._asymptote_lines['horizontal'].set_data(*self._axis_spanning_segments(horizontal)[::-1])
         
-        # Oblique asymptotes (simplified)
+        # Oblique asymptotes, evaluated over the whole range at once
         oblique = asymptotes.get('oblique', [])
-        for oa in oblique:
-            if isinstance(oa, str) and '=' in oa:
-                # Try to parse and plot oblique asymptote
-                # This is a simplified implementation
-                try:
-                    # Extract slope and intercept from string like "y = 2*x + 1"
-                    parts = oa.split('=')
-                    if len(parts) == 2:
-                        expr = parts[1].strip()
-                        x_vals = np.linspace(x_range[0], x_range[1], 100)
-                        y_vals = [evaluate_expression(expr, x, {}) for x in x_vals]
-                        y_vals = [y for y in y_vals if y is not None]
-                        if y_vals:
-                            self.ax.plot(x_vals[:len(y_vals)], y_vals, '--', color='yellow', 
-                                        alpha=0.7, linewidth=1,
-                                        label='Asíntotas oblicuas' if oa == oblique[0] else "")
-                except:
-                    pass
-    
-    def _set_plot_limits(self, y_vals: np.ndarray):
+        oblique_fns = [fn for fn in map(_compile_oblique_asymptote, oblique) if fn is not None]
+        x_vals = _x_grid(round(x_range[0], 6), round(x_range[1], 6), 100)
+        oblique_xs = [np.append(x_vals, np.nan) for _ in oblique_fns]
+        oblique_ys = [np.append(np.broadcast_to(fn(x_vals), x_vals.shape), np.nan) for fn in oblique_fns]
+        self._asymptote_lines['oblique'].set_data(
+            np.concatenate(oblique_xs) if oblique_fns else [],
+            np.concatenate(oblique_ys) if oblique_fns else [])
+        
+        drawn = {'vertical': vertical.size, 'horizontal': horizontal.size, 'oblique': len(oblique_fns)}
+        return [category for category, count in drawn.items() if count]
+    
+    @staticmethod
+    def _axis_spanning_segments(values: "np.ndarray") -> tuple:
+        """
+        Build NaN-separated segments from 0 to 1 (in axes units) at each value.
+        
+        Returns:
+            Tuple (positions, extents) to draw one line holding every segment
+        """
+        positions = np.repeat(values, 3)
+        positions[2::3] = np.nan
+        extents = np.tile([0.0, 1.0, np.nan], values.size)
+        return positions, extents
+    
+    def _set_plot_limits(self, y_vals: "np.ndarray"):
         """Set appropriate plot limits."""
-        # Y-limits based on function values
-        valid_y = y_vals[np.isfinite(y_vals)]
+        # Y-limits based on the finite function values (inf and NaN are ignored)
+        finite = np.isfinite(y_vals)
         
-        if len(valid_y) > 0:
-            y_min, y_max = np.min(valid_y), np.max(valid_y)
+        if finite.any():
+            y_min = np.nanmin(y_vals, where=finite, initial=np.inf)
+            y_max = np.nanmax(y_vals, where=finite, initial=-np.inf)
             y_range = y_max - y_min
             
             if y_range > 0:
@@ -573,7 +1027,7 @@ class App(ctk.CTk):
         
         try:
             # Create and show analysis window
-            analysis_window = ShowInfoFrame(self, self.analysis_results)
+            analysis_window = show_analysis_results(self, self.analysis_results)
             # Bring the analysis window to the front
             analysis_window.lift()
             analysis_window.focus_force()
@@ -587,9 +1041,33 @@ class App(ctk.CTk):
         self.status_label.configure(text=f"Error: {message}")
 
 
+def _warm_up_latex():
+    """Import the report module and render a throwaway LaTeX expression; runs in a daemon thread."""
+    try:
+        from Interface.show_info import warm_up_latex
+        warm_up_latex()
+    except Exception as e:
+        logger.warning("Error warming up LaTeX rendering: %s", e)
+
+
 def main():
     """Main function to run the application."""
+    global _THEME_SET
+    
+    # Analysis and rendering errors go to stderr, as they did when they were printed
+    logging.basicConfig(format="%(name)s: %(message)s")
+    
+    # Set appearance mode and color theme once per process; both reload theme files
+    if not _THEME_SET:
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+        _THEME_SET = True
+    
     app = App()
+    
+    # Load matplotlib and the mathtext fonts while the user types the function
+    threading.Thread(target=_warm_up_latex, daemon=True).start()
+    
     app.mainloop()
 
 
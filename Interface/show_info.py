@@ -6,17 +6,289 @@ display window for mathematical function analysis results using CustomTkinter.
 """
 
 import customtkinter as ctk
-from typing import Dict, Any, List, Union
-import tkinter as tk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
+from matplotlib import mathtext
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 import sympy as sp
 import io
-from PIL import Image, ImageTk
+import gc
+import logging
+import queue
+import re
+import threading
+from PIL import Image, ImageOps, ImageTk
 import numpy as np
 
 
+# Errors are logged, not printed; applications decide where they go
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class LatexItem(NamedTuple):
+    """A section body entry rendered as a LaTeX image."""
+    latex_string: str
+    label_text: str = ""
+    font_size: int = 14
+
+
+# Margin (pixels) around each rendered LaTeX expression, and the widest image shown
+_LATEX_PADDING = 12
+_LATEX_MAX_WIDTH = 800
+
+# Resolution of the rendered expressions and vertical gap (points) between batched rows
+_LATEX_DPI = 120
+_LATEX_ROW_GAP = 4
+
+# Measures expressions for the batched layout
+_MATHTEXT_PARSER = mathtext.MathTextParser('path')
+
+# Serializes mathtext rendering between the section worker and the main thread
+_MATHTEXT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _latex_sheet_canvas() -> FigureCanvasAgg:
+    """Return the Agg canvas shared by every LaTeX batch render (guarded by _MATHTEXT_LOCK)."""
+    return FigureCanvasAgg(Figure(dpi=_LATEX_DPI))
+
+
+def _render_latex_images(latex_keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Optional[Image.Image]]:
+    """
+    Render several LaTeX strings as white text on the dark report background.
+    
+    All expressions are laid out as rows of one figure that is drawn once;
+    the rows are then cropped out at the positions computed from their
+    mathtext metrics. Uses only matplotlib and PIL, never Tk, so it may run
+    in a worker thread. The mathtext parser keeps global state, so renders
+    are serialized.
+    
+    Args:
+        latex_keys: (latex string, font size) pairs to render
+        
+    Returns:
+        Dictionary mapping each pair to its PIL image, or None if rendering it failed
+    """
+    images = {key: None for key in latex_keys}
+    
+    with _MATHTEXT_LOCK:
+        # Measure every expression (points at 72 dpi); unparsable ones are left out
+        rows = []
+        top = 0.0
+        for key in latex_keys:
+            latex_string, font_size = key
+            prop = FontProperties(size=font_size, family='serif')
+            try:
+                width, height, depth, _, _ = _MATHTEXT_PARSER.parse(f'${latex_string}$', dpi=72, prop=prop)
+            except Exception as e:
+                logger.warning("Error creating LaTeX image: %s", e)
+                continue
+            rows.append((key, prop, top, width, height, depth))
+            top += height + _LATEX_ROW_GAP
+        
+        if not rows:
+            return images
+        
+        try:
+            # Render the rows into one Agg buffer, without building any Axes
+            fig_width = max(row[3] for row in rows)
+            fig_height = top
+            canvas = _latex_sheet_canvas()
+            fig = canvas.figure
+            fig.clear()
+            fig.set_size_inches(fig_width / 72.0, fig_height / 72.0)
+            for (latex_string, _), prop, row_top, _, height, depth in rows:
+                baseline = fig_height - row_top - height + depth
+                fig.text(0, baseline / fig_height, f'${latex_string}$', fontproperties=prop, color='black')
+            
+            # Read the pixels straight from the canvas; no PNG encode/decode
+            canvas.draw()
+            width, height = canvas.get_width_height()
+            sheet = Image.frombuffer('RGBA', (width, height), canvas.buffer_rgba(),
+                                     'raw', 'RGBA', 0, 1).convert('L')
+        except Exception as e:
+            logger.warning("Error creating LaTeX image: %s", e)
+            return images
+    
+    scale = _LATEX_DPI / 72.0
+    for key, _, row_top, width, height, _ in rows:
+        crop_box = (0, int(row_top * scale), int(np.ceil(width * scale)),
+                    int(np.ceil((row_top + height) * scale)))
+        images[key] = _finish_latex_image(sheet.crop(crop_box))
+    
+    return images
+
+
+def _render_latex_image(latex_string: str, font_size: int) -> Optional[Image.Image]:
+    """
+    Render a single LaTeX string as white text on the dark report background.
+    
+    Args:
+        latex_string: The LaTeX string to render
+        font_size: Font size for the rendered text
+        
+    Returns:
+        PIL image, or None if rendering fails
+    """
+    return _render_latex_images([(latex_string, font_size)])[(latex_string, font_size)]
+
+
+def warm_up_latex():
+    """
+    Render a throwaway expression so the mathtext fonts and the shared figure are ready.
+    
+    Meant to run in a background thread at startup; the first report then
+    does not pay the font loading cost.
+    """
+    _render_latex_image('x', 14)
+
+
+def _finish_latex_image(rendered: Image.Image) -> Image.Image:
+    """
+    Turn a black-on-white grayscale rendering into white text on the dark background.
+    
+    Args:
+        rendered: Grayscale rendering of one expression
+        
+    Returns:
+        RGB image with a margin, scaled down if wider than the report allows
+    """
+    # Use the inverted luminance as a mask to paint white text onto the dark background
+    coverage = ImageOps.invert(rendered)
+    pil_image = Image.new('RGB', (coverage.width + 2 * _LATEX_PADDING,
+                                  coverage.height + 2 * _LATEX_PADDING), (43, 43, 43))
+    pil_image.paste((255, 255, 255), (_LATEX_PADDING, _LATEX_PADDING,
+                                      _LATEX_PADDING + coverage.width,
+                                      _LATEX_PADDING + coverage.height), mask=coverage)
+    
+    # Resize in place if too large; bilinear is plenty for a UI-sized downscale
+    if pil_image.width > _LATEX_MAX_WIDTH:
+        pil_image.thumbnail((_LATEX_MAX_WIDTH, pil_image.height), Image.Resampling.BILINEAR)
+    
+    return pil_image
+
+
+@lru_cache(maxsize=256)
+def _sympify_to_latex_cached(expr_str: str) -> str:
+    """
+    Parse an expression string with SymPy and convert it to LaTeX.
+    
+    Args:
+        expr_str: String representation of a SymPy expression
+        
+    Returns:
+        LaTeX formatted string, using \\ln for the natural logarithm
+    """
+    latex_str = sp.latex(sp.sympify(expr_str))
+    
+    # Clean up LaTeX formatting
+    return latex_str.replace('\\log', '\\ln')  # Use ln instead of log for natural log
+
+
+class _Analysis(NamedTuple):
+    """The analysis results shown in the report, with the default of each missing entry."""
+    function_string: str = 'No disponible'
+    parsed_function: Any = 'No disponible'
+    parameters: Dict[str, float] = {}
+    first_derivative: Any = 'No disponible'
+    second_derivative: Any = 'No disponible'
+    domain: Any = 'No disponible'
+    intercepts: Dict[str, Any] = {}
+    symmetry: str = 'No determinada'
+    asymptotes: Dict[str, list] = {}
+    critical_points: List[float] = []
+    critical_points_values: Dict[str, Any] = {}
+    inflection_points: List[float] = []
+    inflection_points_values: Dict[str, Any] = {}
+    monotonicity: Dict[str, list] = {}
+    concavity: Dict[str, list] = {}
+
+
+def _parse_analysis(results: Dict[str, Any]) -> _Analysis:
+    """
+    Pick the reported entries out of an analysis results dictionary.
+    
+    Args:
+        results: Dictionary containing function analysis results
+        
+    Returns:
+        _Analysis with the known entries; unknown keys are ignored
+    """
+    return _Analysis(**{key: results[key] for key in _Analysis._fields if key in results})
+
+
+# Expressions shown without SymPy: numbers, x, + - * and single-digit integer
+# powers (x**2.5 would render as x squared followed by .5)
+_TRIVIAL_EXPR_RE = re.compile(r'(?:[-+0-9x.\s]|\*(?!\*)|\*\*\d(?![\d.]))+')
+
+
+# Section titles, the ShowInfoFrame formatter of each section body and the
+# _Analysis fields passed to it, in display order
+_SECTIONS = (
+    ("INFORMACIÓN DE LA FUNCIÓN", "_fmt_function_info",
+     ('function_string', 'parsed_function', 'parameters')),
+    ("DERIVADAS", "_fmt_derivatives", ('first_derivative', 'second_derivative')),
+    ("DOMINIO", "_fmt_domain", ('domain',)),
+    ("INTERCEPTOS", "_fmt_intercepts", ('intercepts',)),
+    ("SIMETRÍA", "_fmt_symmetry", ('symmetry',)),
+    ("ASÍNTOTAS", "_fmt_asymptotes", ('asymptotes',)),
+    ("PUNTOS CRÍTICOS", "_fmt_critical_points", ('critical_points', 'critical_points_values')),
+    ("PUNTOS DE INFLEXIÓN", "_fmt_inflection_points",
+     ('inflection_points', 'inflection_points_values')),
+    ("MONOTONÍA", "_fmt_monotonicity", ('monotonicity',)),
+    ("CONCAVIDAD", "_fmt_concavity", ('concavity',)),
+)
+
+
+# Display text for each symmetry result
+_SYMMETRY_LABELS = {
+    'even': 'Par (simétrica respecto al eje Y)',
+    'odd': 'Impar (simétrica respecto al origen)',
+    'neither': 'Ni par ni impar'
+}
+
+
+# Infinity sentinels used by the interval formatter
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
+
+@lru_cache(maxsize=512, typed=True)
+def _str_cached(result: Any) -> str:
+    """Return str(result), memoized for hashable results such as SymPy objects."""
+    return str(result)
+
+
+@lru_cache(maxsize=256)
+def _format_intervals_cached(intervals: Tuple[tuple, ...], bound_types: Tuple[tuple, ...]) -> str:
+    """
+    Format a tuple of (start, end) intervals for display.
+    
+    Args:
+        intervals: Intervals as tuples; entries without exactly two bounds are skipped
+        bound_types: Types of the bounds, only part of the cache key so that
+            equal values of different types (1 and 1.0) are not conflated
+        
+    Returns:
+        Comma-separated intervals, or "No existen" if none are valid
+    """
+    formatted_intervals = []
+    for interval in intervals:
+        if len(interval) != 2:
+            continue
+        start, end = interval
+        # Handle infinity values
+        start_str = "-∞" if start == _NEG_INF else str(start)
+        end_str = "+∞" if end == _POS_INF else str(end)
+        formatted_intervals.append(f"({start_str}, {end_str})")
+    
+    return ", ".join(formatted_intervals) or "No existen"
+
+
 class ShowInfoFrame(ctk.CTkToplevel):
     """
     A CustomTkinter window for displaying comprehensive function analysis results.
@@ -25,6 +297,25 @@ class ShowInfoFrame(ctk.CTkToplevel):
     analysis including derivatives, domain, intercepts, asymptotes, and behavior analysis.
     """
     
+    # Window reused by show_analysis_results while it exists
+    _instance = None
+    
+    # Rendered LaTeX images keyed by (latex string, font size, Tk interpreter),
+    # least recently used first; every new function or parameter value adds
+    # entries, so only the most recent _LATEX_CACHE_SIZE are kept
+    _latex_cache: "OrderedDict[tuple, ImageTk.PhotoImage]" = OrderedDict()
+    _LATEX_CACHE_SIZE = 256
+    
+    # Title, section, body, bold, monospace and button fonts, keyed by Tk interpreter
+    _fonts: Dict[int, tuple] = {}
+    
+    # Text templates of the critical and inflection points sections
+    _TPL_POINTS = "{label}: {points}{values}"
+    _TPL_VALUES = "\nValores: {}"
+    
+    # Interval (ms) between checks for the section texts computed in the background
+    POLL_INTERVAL_MS = 20
+    
     def __init__(self, master, analysis_results: Dict[str, Any]):
         """
         Initialize the ShowInfoFrame window.
@@ -35,7 +326,25 @@ class ShowInfoFrame(ctk.CTkToplevel):
         """
         super().__init__(master)
         
+        # Fonts shared by every window on this Tk interpreter, created once
+        fonts = ShowInfoFrame._fonts.get(id(self.tk))
+        if fonts is None:
+            fonts = ShowInfoFrame._fonts[id(self.tk)] = (
+                ctk.CTkFont(size=24, weight="bold"),
+                ctk.CTkFont(size=18, weight="bold"),
+                ctk.CTkFont(size=14),
+                ctk.CTkFont(size=14, weight="bold"),
+                ctk.CTkFont(size=12, family="Courier"),
+                ctk.CTkFont(size=16, weight="bold"),
+            )
+        (self._font_title, self._font_section, self._font_body,
+         self._font_body_bold, self._font_mono, self._font_button) = fonts
+        
         self.analysis_results = analysis_results
+        self._latex_images = []
+        self._sections_queue = None
+        self._poll_after_id = None
+        self._rendered_latex = {}
         self.title("Análisis Detallado de la Función")
         self.geometry("900x1000")
         self.resizable(True, True)
@@ -44,80 +353,83 @@ class ShowInfoFrame(ctk.CTkToplevel):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         
-        # Create main scrollable frame
-        self.main_frame = ctk.CTkScrollableFrame(self, corner_radius=0)
-        self.main_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        self.main_frame.grid_columnconfigure(0, weight=1)
+        # A single read-only text widget holds the whole report
+        self.textbox = ctk.CTkTextbox(self, wrap="word", font=self._font_body, corner_radius=0)
+        self.textbox.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        self._configure_text_tags()
         
         # Setup the interface
         self._setup_interface()
         
+        # Stop polling once the window is gone
+        self.bind("<Destroy>", self._on_destroy)
+        
         # Focus on this window
         self.focus()
         self.lift()
     
-    def _create_latex_image(self, latex_string: str, font_size: int = 14) -> ImageTk.PhotoImage:
+    def _on_destroy(self, event):
+        """Stop polling when the window itself is destroyed."""
+        if event.widget is self:
+            if ShowInfoFrame._instance is self:
+                ShowInfoFrame._instance = None
+            if self._poll_after_id is not None:
+                self.after_cancel(self._poll_after_id)
+                self._poll_after_id = None
+    
+    def _configure_text_tags(self):
+        """Configure the text tags used for headings, body text and LaTeX fallbacks."""
+        # CTkTextbox.tag_config rejects fonts, so configure the underlying tk.Text
+        text = self.textbox._textbox
+        heading_color = "lightblue" if ctk.get_appearance_mode() == "Dark" else "blue"
+        text.tag_configure("h1", font=self._font_title, justify="center",
+                           spacing1=10, spacing3=20)
+        text.tag_configure("h2", font=self._font_section, foreground=heading_color,
+                           lmargin1=20, lmargin2=20, spacing1=10, spacing3=5)
+        text.tag_configure("body", lmargin1=40, lmargin2=40, spacing1=2, spacing3=2)
+        text.tag_configure("bold", font=self._font_body_bold, lmargin1=40, lmargin2=40,
+                           spacing1=5, spacing3=2)
+        text.tag_configure("mono", font=self._font_mono, lmargin1=60, lmargin2=60,
+                           spacing1=2, spacing3=2)
+    
+    def _create_latex_image(self, latex_string: str, font_size: int = 14,
+                            rendered: Optional[Image.Image] = None) -> ImageTk.PhotoImage:
         """
         Create an image from a LaTeX string using matplotlib.
         
         Args:
             latex_string: The LaTeX string to render
             font_size: Font size for the rendered text
+            rendered: Image already produced by _render_latex_image, if any
             
         Returns:
             ImageTk.PhotoImage object for display in tkinter
         """
+        # Images belong to a Tk interpreter, so the interpreter is part of the key
+        cache_key = (latex_string, font_size, id(self.tk))
+        cached = ShowInfoFrame._latex_cache.get(cache_key)
+        if cached is not None:
+            ShowInfoFrame._latex_cache.move_to_end(cache_key)
+            return cached
+        
+        if rendered is None:
+            rendered = _render_latex_image(latex_string, font_size)
+        if rendered is None:
+            return None
+        
         try:
-            # Set matplotlib to use dark theme colors
-            plt.style.use('dark_background')
-            
-            # Create a figure with appropriate size
-            fig, ax = plt.subplots(figsize=(10, 1.2), dpi=120)
-            fig.patch.set_facecolor('#2b2b2b')  # Dark background
-            ax.set_facecolor('#2b2b2b')
-            
-            # Render the LaTeX text
-            ax.text(0.02, 0.5, f'${latex_string}$', 
-                   fontsize=font_size, 
-                   transform=ax.transAxes, 
-                   verticalalignment='center',
-                   horizontalalignment='left',
-                   color='white',
-                   family='serif')
-            
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            
-            # Save to bytes buffer with tight bounding box
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', bbox_inches='tight', 
-                       facecolor='#2b2b2b', edgecolor='none', 
-                       dpi=120, pad_inches=0.1)
-            buf.seek(0)
-            
-            # Convert to PIL Image and then to PhotoImage
-            pil_image = Image.open(buf)
-            
-            # Resize if too large
-            max_width = 800
-            if pil_image.width > max_width:
-                ratio = max_width / pil_image.width
-                new_height = int(pil_image.height * ratio)
-                pil_image = pil_image.resize((max_width, new_height), Image.Resampling.LANCZOS)
-            
-            photo = ImageTk.PhotoImage(pil_image)
-            
-            plt.close(fig)
-            buf.close()
-            
+            photo = ImageTk.PhotoImage(rendered)
+            ShowInfoFrame._latex_cache[cache_key] = photo
+            # Evicted images stay alive while a report still shows them (_latex_images)
+            while len(ShowInfoFrame._latex_cache) > ShowInfoFrame._LATEX_CACHE_SIZE:
+                ShowInfoFrame._latex_cache.popitem(last=False)
             return photo
             
         except Exception as e:
-            print(f"Error creating LaTeX image: {e}")
+            logger.warning("Error creating LaTeX image: %s", e)
             return None
     
-    def _sympy_to_latex(self, expr_str: str) -> str:
+    def _sympy_to_latex(self, expr_str: str) -> Optional[str]:
         """
         Convert a SymPy expression string to LaTeX format.
         
@@ -125,361 +437,282 @@ class ShowInfoFrame(ctk.CTkToplevel):
             expr_str: String representation of a SymPy expression
             
         Returns:
-            LaTeX formatted string
+            LaTeX formatted string, or None if the expression cannot be converted
         """
+        if isinstance(expr_str, dict) and 'error' in expr_str:
+            return r"\text{Error: " + str(expr_str['error']).replace('_', r'\_') + "}"
+        
+        if expr_str == 'No disponible' or expr_str is None:
+            return r"\text{No disponible}"
+        
+        # Polynomial-like expressions are already valid mathtext once the operators are mapped
+        expr_text = str(expr_str).strip()
+        if _TRIVIAL_EXPR_RE.fullmatch(expr_text):
+            return expr_text.replace('**', '^').replace('*', r' \cdot ')
+        
         try:
-            if isinstance(expr_str, dict) and 'error' in expr_str:
-                return r"\text{Error: " + str(expr_str['error']).replace('_', r'\_') + "}"
-            
-            if expr_str == 'No disponible' or expr_str is None:
-                return r"\text{No disponible}"
-            
-            # Convert string to proper format for SymPy
-            expr_str_clean = str(expr_str)
-            
-            # Handle common mathematical functions
-            replacements = {
-                'sqrt': 'sqrt',
-                'log': 'log',
-                'ln': 'log',
-                'sin': 'sin',
-                'cos': 'cos',
-                'tan': 'tan',
-                'exp': 'exp',
-                'pi': 'pi',
-                'e': 'E'
-            }
-            
-            # Parse with SymPy and convert to LaTeX
-            expr = sp.sympify(expr_str_clean)
-            latex_str = sp.latex(expr)
-            
-            # Clean up LaTeX formatting
-            latex_str = latex_str.replace('\\log', '\\ln')  # Use ln instead of log for natural log
-            
-            return latex_str
-            
+            # Parse with SymPy and convert to LaTeX (memoized per expression string)
+            return _sympify_to_latex_cached(expr_text)
         except Exception as e:
-            print(f"Error converting to LaTeX: {e}")
-            # Return a safe LaTeX string
-            safe_str = str(expr_str).replace('_', r'\_').replace('^', r'\hat{}').replace('*', r' \cdot ')
-            return r"\text{" + safe_str + "}"
+            logger.warning("Error converting to LaTeX: %s", e)
+            return None
     
-    def _add_latex_display(self, parent_frame, latex_string: str, row: int, 
-                          label_text: str = "", font_size: int = 14) -> int:
+    def _append_text(self, buffer: io.StringIO, text: str, tag: str):
         """
-        Add a LaTeX rendered mathematical expression to the frame.
+        Append one tagged line to the report being built.
         
         Args:
-            parent_frame: Parent frame to add the display to
-            latex_string: LaTeX string to render
-            row: Current row number
-            label_text: Optional label text
-            font_size: Font size for rendering
-            
-        Returns:
-            Next row number
+            buffer: Report text built so far
+            text: Line contents, without the trailing newline
+            tag: Text tag applied to the line
         """
-        try:
-            if label_text:
-                label = ctk.CTkLabel(
-                    parent_frame,
-                    text=label_text,
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    justify="left"
-                )
-                label.grid(row=row, column=0, sticky="w", padx=40, pady=(5, 2))
-                row += 1
-            
-            # Create LaTeX image
-            latex_image = self._create_latex_image(latex_string, font_size)
-            
-            if latex_image:
-                # Create a frame to hold the LaTeX image with dark background
-                latex_frame = ctk.CTkFrame(parent_frame, fg_color="#2b2b2b", corner_radius=5)
-                latex_frame.grid(row=row, column=0, sticky="ew", padx=60, pady=5)
-                latex_frame.grid_columnconfigure(0, weight=1)
-                
-                # Create label to display the image with matching background
-                image_label = tk.Label(latex_frame, image=latex_image, 
-                                     bg="#2b2b2b", bd=0, highlightthickness=0)
-                image_label.image = latex_image  # Keep a reference
-                image_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
-                
-            else:
-                # Fallback to regular text if LaTeX rendering fails
-                fallback_label = ctk.CTkLabel(
-                    parent_frame,
-                    text=latex_string,
-                    font=ctk.CTkFont(size=12, family="Courier"),
-                    wraplength=600,
-                    justify="left"
-                )
-                fallback_label.grid(row=row, column=0, sticky="w", padx=60, pady=2)
-            
-            return row + 1
-            
-        except Exception as e:
-            print(f"Error adding LaTeX display: {e}")
-            # Fallback to regular text
-            fallback_label = ctk.CTkLabel(
-                parent_frame,
-                text=f"{label_text}: {latex_string}",
-                font=ctk.CTkFont(size=12),
-                wraplength=600,
-                justify="left"
-            )
-            fallback_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-            return row + 1
+        start = buffer.tell()
+        buffer.write(text + "\n")
+        self._tag_ranges.append((tag, start, buffer.tell()))
+    
+    def _append_latex(self, buffer: io.StringIO, item: LatexItem):
+        """
+        Append a LaTeX expression, as an image, to the report being built.
+        
+        Args:
+            buffer: Report text built so far
+            item: Expression to render, with its optional label and font size
+        """
+        if item.label_text:
+            self._append_text(buffer, item.label_text, "bold")
+        
+        rendered = self._rendered_latex.get((item.latex_string, item.font_size))
+        latex_image = self._create_latex_image(item.latex_string, item.font_size, rendered)
+        if latex_image:
+            # The image goes at the start of an empty line once the text is inserted
+            self._latex_images.append(latex_image)
+            self._image_marks.append((buffer.tell(), latex_image))
+            buffer.write("\n")
+        else:
+            # Fallback to regular text if LaTeX rendering fails
+            self._append_text(buffer, item.latex_string, "mono")
     
     def _setup_interface(self):
-        """Setup the complete interface with all analysis sections."""
-        current_row = 0
+        """
+        Setup the complete interface with all analysis sections.
         
-        # Title
-        current_row = self._add_title(current_row)
+        The section texts (SymPy stringification and LaTeX conversion) are
+        computed in a worker thread so the event loop stays responsive; the
+        widgets are filled in on the main thread once they are ready.
+        """
+        self._start_sections()
         
-        # Function Information
-        current_row = self._add_function_info(current_row)
+        # Close button
+        self._add_close_button()
         
-        # Derivatives Section
-        current_row = self._add_derivatives_section(current_row)
+        # Closing only hides the window so it can be reused by show_analysis_results
+        self.protocol("WM_DELETE_WINDOW", self._hide)
+    
+    def refresh(self, analysis_results: Dict[str, Any]):
+        """
+        Show new analysis results in this window, reusing its widgets.
         
-        # Domain Section
-        current_row = self._add_domain_section(current_row)
+        Args:
+            analysis_results: Dictionary containing function analysis results
+        """
+        self.analysis_results = analysis_results
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.yview_moveto(0)
+        self._latex_images.clear()
+        self._start_sections()
+    
+    def _hide(self):
+        """
+        Release the modal grab and hide the window until it is shown again.
         
-        # Intercepts Section
-        current_row = self._add_intercepts_section(current_row)
+        The window is reused rather than destroyed, so the report is cleared
+        here and refresh rebuilds it on the next show. This drops the window's
+        own references to its images; the PhotoImages themselves stay alive in
+        the shared _latex_cache (for reuse by later reports) until its LRU
+        evicts them, which is what bounds their memory.
+        """
+        self.grab_release()
+        self.withdraw()
+        if self._poll_after_id is not None:
+            self.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self._latex_images.clear()
+        gc.collect()
+    
+    def _start_sections(self):
+        """Format the sections in a worker thread and start polling for the result."""
+        if self._poll_after_id is not None:
+            self.after_cancel(self._poll_after_id)
+        
+        # A fresh queue per run, so a superseded worker can never deliver stale sections
+        self._sections_queue = queue.Queue()
+        worker = threading.Thread(target=self._compute_sections,
+                                  args=(self.analysis_results, self._sections_queue, id(self.tk)),
+                                  daemon=True)
+        worker.start()
+        self._poll_sections()
+    
+    def _compute_sections(self, results: Dict[str, Any], sections_queue: queue.Queue, tk_id: int):
+        """
+        Format every analysis section and render its LaTeX; runs in a worker thread and never touches Tk.
         
-        # Symmetry Section
-        current_row = self._add_symmetry_section(current_row)
+        Args:
+            results: Analysis results to format
+            sections_queue: Queue receiving the (title, body items) pairs and the rendered images
+            tk_id: Identity of the Tk interpreter, used to skip cached images
+        """
+        try:
+            # The results are parsed once and each field is handed to its formatter
+            analysis = _parse_analysis(results)
+            sections = []
+            for title, formatter_name, fields in _SECTIONS:
+                values = [getattr(analysis, field) for field in fields]
+                sections.append((title, getattr(self, formatter_name)(*values)))
+            
+            # Render the expressions not cached yet here; only the PhotoImage
+            # conversion is left for the main thread
+            latex_keys = list({
+                (item.latex_string, item.font_size)
+                for _, items in sections for item in items
+                if isinstance(item, LatexItem)
+                and (item.latex_string, item.font_size, tk_id) not in ShowInfoFrame._latex_cache
+            })
+            rendered = _render_latex_images(latex_keys) if latex_keys else {}
+            sections_queue.put((sections, rendered))
+        except Exception as e:
+            logger.warning("Error formatting analysis sections: %s", e)
+            sections_queue.put(([], {}))
+    
+    def _poll_sections(self):
+        """Render the sections once the worker has produced them, otherwise check again later."""
+        try:
+            sections, rendered = self._sections_queue.get_nowait()
+        except queue.Empty:
+            self._poll_after_id = self.after(self.POLL_INTERVAL_MS, self._poll_sections)
+            return
         
-        # Asymptotes Section
-        current_row = self._add_asymptotes_section(current_row)
+        self._poll_after_id = None
+        self._render_sections(sections, rendered)
+    
+    def _render_sections(self, sections: List[tuple], rendered: Dict[tuple, Image.Image]):
+        """
+        Insert the title and the formatted sections into the textbox.
+        
+        The report is written to a buffer first and inserted with a single
+        insert call; tags and LaTeX images are added afterwards at the
+        offsets recorded while building.
+        
+        Args:
+            sections: (title, body items) pairs, in display order
+            rendered: LaTeX images rendered by the worker, keyed by (latex string, font size)
+        """
+        buffer = io.StringIO()
+        self._tag_ranges = []
+        self._image_marks = []
+        self._rendered_latex = rendered
         
-        # Critical Points Section
-        current_row = self._add_critical_points_section(current_row)
+        # Title
+        self._add_title(buffer)
         
-        # Inflection Points Section
-        current_row = self._add_inflection_points_section(current_row)
+        # Analysis sections, one title plus the body items of each formatter
+        for title, items in sections:
+            self._add_section(buffer, title, items)
         
-        # Monotonicity Section
-        current_row = self._add_monotonicity_section(current_row)
+        text = self.textbox._textbox
+        text.insert("1.0", buffer.getvalue())
+        for tag, start, end in self._tag_ranges:
+            text.tag_add(tag, f"1.0 + {start} chars", f"1.0 + {end} chars")
         
-        # Concavity Section
-        current_row = self._add_concavity_section(current_row)
+        # Insert images from the end so earlier offsets stay valid
+        for offset, latex_image in reversed(self._image_marks):
+            text.image_create(f"1.0 + {offset} chars", image=latex_image, padx=60, pady=5)
         
-        # Close button
-        self._add_close_button(current_row)
+        self.textbox.configure(state="disabled")
+        self._tag_ranges = []
+        self._image_marks = []
+        self._rendered_latex = {}
     
-    def _add_title(self, row: int) -> int:
+    def _add_title(self, buffer: io.StringIO):
         """Add the main title."""
-        title_label = ctk.CTkLabel(
-            self.main_frame,
-            text="ANÁLISIS COMPLETO DE LA FUNCIÓN",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=("gray10", "gray90")
-        )
-        title_label.grid(row=row, column=0, sticky="ew", padx=20, pady=(10, 20))
-        return row + 1
-    
-    def _add_function_info(self, row: int) -> int:
-        """Add function information section."""
-        # Section title
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="INFORMACIÓN DE LA FUNCIÓN",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
+        self._append_text(buffer, "ANÁLISIS COMPLETO DE LA FUNCIÓN", "h1")
+    
+    def _add_section(self, buffer: io.StringIO, title: str, items: List[Union[str, LatexItem]]):
+        """
+        Add a section title followed by its body items.
         
+        Args:
+            buffer: Report text built so far
+            title: Section title
+            items: Plain text lines and LaTeX expressions to display, in order
+        """
+        self._append_text(buffer, title, "h2")
+        
+        # Consecutive text lines share one tagged range; only LaTeX items break it up
+        lines = []
+        for item in items:
+            if isinstance(item, LatexItem):
+                if lines:
+                    self._append_text(buffer, "\n".join(lines), "body")
+                    lines = []
+                self._append_latex(buffer, item)
+            else:
+                lines.append(item)
+        if lines:
+            self._append_text(buffer, "\n".join(lines), "body")
+    
+    def _fmt_function_info(self, func_str: str, parsed_func: str,
+                           parameters: Dict[str, float]) -> List[Union[str, LatexItem]]:
+        """Format the function information section."""
         # Function string (original input)
-        func_str = self.analysis_results.get('function_string', 'No disponible')
-        func_label = ctk.CTkLabel(
-            self.main_frame,
-            text=f"Función ingresada: {func_str}",
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        func_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
+        items = [f"Función ingresada: {func_str}"]
         
         # Parsed function in LaTeX
-        parsed_func = self.analysis_results.get('parsed_function', 'No disponible')
         if parsed_func and parsed_func != 'No disponible':
-            try:
-                latex_func = self._sympy_to_latex(parsed_func)
-                row = self._add_latex_display(
-                    self.main_frame, 
-                    f"f(x) = {latex_func}", 
-                    row, 
-                    "Función matemática:",
-                    font_size=16
-                )
-            except Exception as e:
-                print(f"Error rendering function LaTeX: {e}")
-                parsed_label = ctk.CTkLabel(
-                    self.main_frame,
-                    text=f"Función procesada: {parsed_func}",
-                    font=ctk.CTkFont(size=14),
-                    wraplength=700,
-                    justify="left"
-                )
-                parsed_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-                row += 1
+            latex_func = self._sympy_to_latex(parsed_func)
         else:
-            parsed_label = ctk.CTkLabel(
-                self.main_frame,
-                text=f"Función procesada: {parsed_func}",
-                font=ctk.CTkFont(size=14),
-                wraplength=700,
-                justify="left"
-            )
-            parsed_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-            row += 1
-        
-        # Parameters
-        parameters = self.analysis_results.get('parameters', {})
-        if parameters:
-            params_text = ", ".join([f"{k}={v}" for k, v in parameters.items()])
-            params_label = ctk.CTkLabel(
-                self.main_frame,
-                text=f"Parámetros: {params_text}",
-                font=ctk.CTkFont(size=14),
-                wraplength=700,
-                justify="left"
-            )
-            params_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-            row += 1
-        
-        return row + 1
-    
-    def _add_derivatives_section(self, row: int) -> int:
-        """Add derivatives section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="DERIVADAS",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
+            latex_func = None
         
-        # First derivative
-        first_deriv = self.analysis_results.get('first_derivative', 'No disponible')
-        first_deriv_formatted = self._format_result(first_deriv)
-        
-        if first_deriv_formatted and first_deriv_formatted != 'No disponible':
-            try:
-                latex_first = self._sympy_to_latex(first_deriv_formatted)
-                row = self._add_latex_display(
-                    self.main_frame,
-                    f"f'(x) = {latex_first}",
-                    row,
-                    "Primera derivada:",
-                    font_size=14
-                )
-            except Exception as e:
-                print(f"Error rendering first derivative LaTeX: {e}")
-                first_label = ctk.CTkLabel(
-                    self.main_frame,
-                    text=f"Primera derivada: f'(x) = {first_deriv_formatted}",
-                    font=ctk.CTkFont(size=14),
-                    wraplength=700,
-                    justify="left"
-                )
-                first_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-                row += 1
+        if latex_func is not None:
+            items.append(LatexItem(f"f(x) = {latex_func}", "Función matemática:", 16))
         else:
-            first_label = ctk.CTkLabel(
-                self.main_frame,
-                text=f"Primera derivada: f'(x) = {first_deriv_formatted}",
-                font=ctk.CTkFont(size=14),
-                wraplength=700,
-                justify="left"
-            )
-            first_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-            row += 1
+            items.append(f"Función procesada: {parsed_func}")
         
-        # Second derivative
-        second_deriv = self.analysis_results.get('second_derivative', 'No disponible')
-        second_deriv_formatted = self._format_result(second_deriv)
+        # Parameters
+        if parameters:
+            params_text = ", ".join(f"{k}={v}" for k, v in parameters.items())
+            items.append(f"Parámetros: {params_text}")
         
-        if second_deriv_formatted and second_deriv_formatted != 'No disponible':
-            try:
-                latex_second = self._sympy_to_latex(second_deriv_formatted)
-                row = self._add_latex_display(
-                    self.main_frame,
-                    f"f''(x) = {latex_second}",
-                    row,
-                    "Segunda derivada:",
-                    font_size=14
-                )
-            except Exception as e:
-                print(f"Error rendering second derivative LaTeX: {e}")
-                second_label = ctk.CTkLabel(
-                    self.main_frame,
-                    text=f"Segunda derivada: f''(x) = {second_deriv_formatted}",
-                    font=ctk.CTkFont(size=14),
-                    wraplength=700,
-                    justify="left"
-                )
-                second_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-                row += 1
-        else:
-            second_label = ctk.CTkLabel(
-                self.main_frame,
-                text=f"Segunda derivada: f''(x) = {second_deriv_formatted}",
-                font=ctk.CTkFont(size=14),
-                wraplength=700,
-                justify="left"
-            )
-            second_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-            row += 1
-        
-        return row + 1
-    
-    def _add_domain_section(self, row: int) -> int:
-        """Add domain section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="DOMINIO",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        domain = self.analysis_results.get('domain', 'No disponible')
-        domain = self._format_result(domain)
-        domain_label = ctk.CTkLabel(
-            self.main_frame,
-            text=f"Dominio: {domain}",
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        domain_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_intercepts_section(self, row: int) -> int:
-        """Add intercepts section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="INTERCEPTOS",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
+        return items
+    
+    def _fmt_derivatives(self, first_deriv: Any, second_deriv: Any) -> List[Union[str, LatexItem]]:
+        """Format the derivatives section."""
+        items = []
+        derivatives = (
+            (first_deriv, "Primera derivada:", "f'(x)"),
+            (second_deriv, "Segunda derivada:", "f''(x)"),
         )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        intercepts = self.analysis_results.get('intercepts', {})
+        for derivative, label_text, name in derivatives:
+            formatted = self._format_result(derivative)
+            latex_deriv = None
+            if formatted and formatted != 'No disponible':
+                latex_deriv = self._sympy_to_latex(formatted)
+            
+            if latex_deriv is not None:
+                items.append(LatexItem(f"{name} = {latex_deriv}", label_text, 14))
+            else:
+                items.append(f"{label_text} {name} = {formatted}")
         
+        return items
+    
+    def _fmt_domain(self, domain: Any) -> List[str]:
+        """Format the domain section."""
+        return [f"Dominio: {self._format_result(domain)}"]
+    
+    def _fmt_intercepts(self, intercepts: Dict[str, Any]) -> List[str]:
+        """Format the intercepts section."""
         # Y-intercept
         y_intercept = intercepts.get('y_intercept')
         if y_intercept is not None:
@@ -487,336 +720,119 @@ class ShowInfoFrame(ctk.CTkToplevel):
         else:
             y_text = "Intercepto Y: No existe"
         
-        y_label = ctk.CTkLabel(
-            self.main_frame,
-            text=y_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        y_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
         # X-intercepts
         x_intercepts = intercepts.get('x_intercepts', [])
         if x_intercepts:
-            x_points = ", ".join([f"({x}, 0)" for x in x_intercepts])
+            x_points = ", ".join(map("({}, 0)".format, x_intercepts))
             x_text = f"Interceptos X: {x_points}"
         else:
             x_text = "Interceptos X: No existen"
         
-        x_label = ctk.CTkLabel(
-            self.main_frame,
-            text=x_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        x_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_symmetry_section(self, row: int) -> int:
-        """Add symmetry section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="SIMETRÍA",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        symmetry = self.analysis_results.get('symmetry', 'No determinada')
-        symmetry_map = {
-            'even': 'Par (simétrica respecto al eje Y)',
-            'odd': 'Impar (simétrica respecto al origen)',
-            'neither': 'Ni par ni impar'
-        }
-        symmetry_text = symmetry_map.get(symmetry, symmetry)
-        
-        symmetry_label = ctk.CTkLabel(
-            self.main_frame,
-            text=f"Tipo de simetría: {symmetry_text}",
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        symmetry_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_asymptotes_section(self, row: int) -> int:
-        """Add asymptotes section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="ASÍNTOTAS",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        asymptotes = self.analysis_results.get('asymptotes', {})
-        
+        return [y_text, x_text]
+    
+    def _fmt_symmetry(self, symmetry: str) -> List[str]:
+        """Format the symmetry section."""
+        symmetry_text = _SYMMETRY_LABELS.get(symmetry, symmetry)
+        return [f"Tipo de simetría: {symmetry_text}"]
+    
+    def _fmt_asymptotes(self, asymptotes: Dict[str, list]) -> List[str]:
+        """Format the asymptotes section."""
         # Vertical asymptotes
         vertical = asymptotes.get('vertical', [])
         if vertical:
-            v_text = f"Asíntotas verticales: x = {', x = '.join(map(str, vertical))}"
+            v_text = "Asíntotas verticales: " + ", ".join(map("x = {}".format, vertical))
         else:
             v_text = "Asíntotas verticales: No existen"
         
-        v_label = ctk.CTkLabel(
-            self.main_frame,
-            text=v_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        v_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
         # Horizontal asymptotes
         horizontal = asymptotes.get('horizontal', [])
         if horizontal:
-            h_text = f"Asíntotas horizontales: y = {', y = '.join(map(str, horizontal))}"
+            h_text = "Asíntotas horizontales: " + ", ".join(map("y = {}".format, horizontal))
         else:
             h_text = "Asíntotas horizontales: No existen"
         
-        h_label = ctk.CTkLabel(
-            self.main_frame,
-            text=h_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        h_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
         # Oblique asymptotes
         oblique = asymptotes.get('oblique', [])
         if oblique:
-            o_text = f"Asíntotas oblicuas: {', '.join(oblique)}"
+            o_text = "Asíntotas oblicuas: " + ", ".join(oblique)
         else:
             o_text = "Asíntotas oblicuas: No existen"
         
-        o_label = ctk.CTkLabel(
-            self.main_frame,
-            text=o_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        o_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_critical_points_section(self, row: int) -> int:
-        """Add critical points section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="PUNTOS CRÍTICOS",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        critical_points = self.analysis_results.get('critical_points', [])
-        if critical_points:
-            points_text = ", ".join([f"x = {point}" for point in critical_points])
-            cp_text = f"Puntos críticos: {points_text}"
-            
-            # Add function values if available
-            critical_values = self.analysis_results.get('critical_points_values', {})
-            if critical_values:
-                values_text = []
-                for point in critical_points:
-                    value = critical_values.get(str(point))
-                    if value is not None:
-                        values_text.append(f"f({point}) = {value}")
-                if values_text:
-                    cp_text += f"\nValores: {', '.join(values_text)}"
-        else:
-            cp_text = "Puntos críticos: No existen"
-        
-        cp_label = ctk.CTkLabel(
-            self.main_frame,
-            text=cp_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        cp_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_inflection_points_section(self, row: int) -> int:
-        """Add inflection points section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="PUNTOS DE INFLEXIÓN",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        inflection_points = self.analysis_results.get('inflection_points', [])
-        if inflection_points:
-            points_text = ", ".join([f"x = {point}" for point in inflection_points])
-            ip_text = f"Puntos de inflexión: {points_text}"
-            
-            # Add function values if available
-            inflection_values = self.analysis_results.get('inflection_points_values', {})
-            if inflection_values:
-                values_text = []
-                for point in inflection_points:
-                    value = inflection_values.get(str(point))
-                    if value is not None:
-                        values_text.append(f"f({point}) = {value}")
-                if values_text:
-                    ip_text += f"\nValores: {', '.join(values_text)}"
-        else:
-            ip_text = "Puntos de inflexión: No existen"
-        
-        ip_label = ctk.CTkLabel(
-            self.main_frame,
-            text=ip_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        ip_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_monotonicity_section(self, row: int) -> int:
-        """Add monotonicity section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="MONOTONÍA",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        monotonicity = self.analysis_results.get('monotonicity', {})
-        
-        # Increasing intervals
-        increasing = monotonicity.get('increasing', [])
-        if increasing:
-            inc_intervals = self._format_intervals(increasing)
-            inc_text = f"Intervalos crecientes: {inc_intervals}"
-        else:
-            inc_text = "Intervalos crecientes: No existen"
-        
-        inc_label = ctk.CTkLabel(
-            self.main_frame,
-            text=inc_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        inc_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        # Decreasing intervals
-        decreasing = monotonicity.get('decreasing', [])
-        if decreasing:
-            dec_intervals = self._format_intervals(decreasing)
-            dec_text = f"Intervalos decrecientes: {dec_intervals}"
-        else:
-            dec_text = "Intervalos decrecientes: No existen"
-        
-        dec_label = ctk.CTkLabel(
-            self.main_frame,
-            text=dec_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        dec_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
-    
-    def _add_concavity_section(self, row: int) -> int:
-        """Add concavity section."""
-        section_title = ctk.CTkLabel(
-            self.main_frame,
-            text="CONCAVIDAD",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("blue", "lightblue")
-        )
-        section_title.grid(row=row, column=0, sticky="w", padx=20, pady=(10, 5))
-        row += 1
-        
-        concavity = self.analysis_results.get('concavity', {})
-        
-        # Concave up intervals
-        concave_up = concavity.get('concave_up', [])
-        if concave_up:
-            up_intervals = self._format_intervals(concave_up)
-            up_text = f"Intervalos cóncavos hacia arriba: {up_intervals}"
-        else:
-            up_text = "Intervalos cóncavos hacia arriba: No existen"
-        
-        up_label = ctk.CTkLabel(
-            self.main_frame,
-            text=up_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        up_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        # Concave down intervals
-        concave_down = concavity.get('concave_down', [])
-        if concave_down:
-            down_intervals = self._format_intervals(concave_down)
-            down_text = f"Intervalos cóncavos hacia abajo: {down_intervals}"
-        else:
-            down_text = "Intervalos cóncavos hacia abajo: No existen"
-        
-        down_label = ctk.CTkLabel(
-            self.main_frame,
-            text=down_text,
-            font=ctk.CTkFont(size=14),
-            wraplength=700,
-            justify="left"
-        )
-        down_label.grid(row=row, column=0, sticky="w", padx=40, pady=2)
-        row += 1
-        
-        return row + 1
+        return [v_text, h_text, o_text]
+    
+    def _fmt_points(self, points: List[float], values: Dict[str, Any], label: str) -> List[str]:
+        """Format a list of points and, if available, the function values at them."""
+        if not points:
+            return [f"{label}: No existen"]
+        
+        points_text = ", ".join(map("x = {}".format, points))
+        
+        # Add function values if available
+        values_text = ""
+        if values:
+            point_values = [
+                f"f({point}) = {values[str(point)]}"
+                for point in points if values.get(str(point)) is not None
+            ]
+            if point_values:
+                values_text = self._TPL_VALUES.format(", ".join(point_values))
+        
+        return [self._TPL_POINTS.format(label=label, points=points_text, values=values_text)]
+    
+    def _fmt_critical_points(self, points: List[float], values: Dict[str, Any]) -> List[str]:
+        """Format the critical points section."""
+        return self._fmt_points(points, values, "Puntos críticos")
+    
+    def _fmt_inflection_points(self, points: List[float], values: Dict[str, Any]) -> List[str]:
+        """Format the inflection points section."""
+        return self._fmt_points(points, values, "Puntos de inflexión")
     
-    def _add_close_button(self, row: int):
+    def _fmt_monotonicity(self, monotonicity: Dict[str, list]) -> List[str]:
+        """Format the monotonicity section."""
+        return [
+            self._fmt_interval_line("Intervalos crecientes", monotonicity.get('increasing', [])),
+            self._fmt_interval_line("Intervalos decrecientes", monotonicity.get('decreasing', [])),
+        ]
+    
+    def _fmt_concavity(self, concavity: Dict[str, list]) -> List[str]:
+        """Format the concavity section."""
+        return [
+            self._fmt_interval_line("Intervalos cóncavos hacia arriba", concavity.get('concave_up', [])),
+            self._fmt_interval_line("Intervalos cóncavos hacia abajo", concavity.get('concave_down', [])),
+        ]
+    
+    def _fmt_interval_line(self, label: str, intervals: List[tuple]) -> str:
+        """Format one labelled line of intervals."""
+        if intervals:
+            return f"{label}: {self._format_intervals(intervals)}"
+        return f"{label}: No existen"
+    
+    def _add_close_button(self):
         """Add close button."""
         close_button = ctk.CTkButton(
-            self.main_frame,
+            self,
             text="Cerrar",
-            command=self.destroy,
+            command=self._hide,
             width=200,
             height=40,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_button
         )
-        close_button.grid(row=row, column=0, pady=20)
+        close_button.grid(row=1, column=0, pady=(0, 20))
     
     def _format_result(self, result: Any) -> str:
         """Format analysis result for display."""
+        # Most results are already strings
+        if isinstance(result, str):
+            return result
+        if result is None:
+            return "No disponible"
         if isinstance(result, dict) and 'error' in result:
             return f"Error: {result['error']}"
-        elif result is None:
-            return "No disponible"
-        else:
+        
+        try:
+            return _str_cached(result)
+        except TypeError:
+            # Unhashable results (lists, dicts) are formatted directly
             return str(result)
     
     def _format_intervals(self, intervals: List[tuple]) -> str:
@@ -824,16 +840,11 @@ class ShowInfoFrame(ctk.CTkToplevel):
         if not intervals:
             return "No existen"
         
-        formatted_intervals = []
-        for interval in intervals:
-            if len(interval) == 2:
-                start, end = interval
-                # Handle infinity values
-                start_str = "-∞" if start == float('-inf') else str(start)
-                end_str = "+∞" if end == float('inf') else str(end)
-                formatted_intervals.append(f"({start_str}, {end_str})")
-        
-        return ", ".join(formatted_intervals) if formatted_intervals else "No existen"
+        try:
+            key = tuple(map(tuple, intervals))
+            return _format_intervals_cached(key, tuple(tuple(map(type, interval)) for interval in key))
+        except TypeError:
+            return "No existen"
 
 
 # Utility function for quick display
@@ -848,4 +859,12 @@ def show_analysis_results(master, analysis_results: Dict[str, Any]) -> ShowInfoF
     Returns:
         ShowInfoFrame instance
     """
-    return ShowInfoFrame(master, analysis_results)
+    window = ShowInfoFrame._instance
+    if window is not None and window.winfo_exists():
+        window.refresh(analysis_results)
+        window.deiconify()
+        return window
+    
+    window = ShowInfoFrame(master, analysis_results)
+    ShowInfoFrame._instance = window
+    return window
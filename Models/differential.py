@@ -5,9 +5,18 @@ This module provides the DifferentialCalculator class that computes
 first and second derivatives of mathematical functions using SymPy.
 """
 
+import logging
 import sympy as sp
-from sympy import diff, Symbol
-from typing import Optional, Union
+from sympy import Symbol
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+from Utils.math_utils import cached_sympify, differentiate, real_polynomial_roots
+
+
+# Errors are logged, not printed; applications decide where they go
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class DifferentialCalculator:
@@ -18,18 +27,21 @@ class DifferentialCalculator:
     of SymPy expressions with robust error handling.
     """
     
-    def __init__(self, sympy_function: sp.Expr, variable: Symbol):
+    def __init__(self, sympy_function: sp.Expr, variable: Symbol,
+                 derivatives: Optional[Dict[int, sp.Expr]] = None):
         """
         Initialize the DifferentialCalculator.
         
         Args:
             sympy_function: The SymPy expression to differentiate
             variable: The SymPy symbol representing the variable of differentiation
+            derivatives: Optional derivatives already known, keyed by order
         """
         self.function = sympy_function
         self.variable = variable
-        self._first_derivative = None
-        self._second_derivative = None
+        # Derivatives computed so far and their string forms, keyed by order
+        self._cache: Dict[int, sp.Expr] = dict(derivatives or {})
+        self._str_cache: Dict[int, Optional[str]] = {}
     
     def get_first_derivative(self) -> Optional[sp.Expr]:
         """
@@ -39,12 +51,12 @@ class DifferentialCalculator:
             SymPy expression representing the first derivative, or None if calculation fails
         """
         try:
-            if self._first_derivative is None:
-                self._first_derivative = diff(self.function, self.variable)
-            return self._first_derivative
+            if 1 not in self._cache:
+                self._cache[1] = differentiate(self.function, self.variable)
+            return self._cache[1]
         except Exception as e:
             # Handle any differentiation errors
-            print(f"Error calculating first derivative: {e}")
+            logger.warning("Error calculating first derivative: %s", e)
             return None
     
     def get_second_derivative(self) -> Optional[sp.Expr]:
@@ -55,18 +67,18 @@ class DifferentialCalculator:
             SymPy expression representing the second derivative, or None if calculation fails
         """
         try:
-            if self._second_derivative is None:
+            if 2 not in self._cache:
                 # Calculate second derivative directly or from first derivative
                 first_deriv = self.get_first_derivative()
                 if first_deriv is not None:
-                    self._second_derivative = diff(first_deriv, self.variable)
+                    self._cache[2] = differentiate(first_deriv, self.variable)
                 else:
                     # Try direct calculation if first derivative failed
-                    self._second_derivative = diff(self.function, self.variable, 2)
-            return self._second_derivative
+                    self._cache[2] = differentiate(self.function, self.variable, 2)
+            return self._cache[2]
         except Exception as e:
             # Handle any differentiation errors
-            print(f"Error calculating second derivative: {e}")
+            logger.warning("Error calculating second derivative: %s", e)
             return None
     
     def get_derivative(self, order: int = 1) -> Optional[sp.Expr]:
@@ -87,10 +99,12 @@ class DifferentialCalculator:
             elif order == 2:
                 return self.get_second_derivative()
             else:
-                # For higher order derivatives
-                return diff(self.function, self.variable, order)
+                # For higher order derivatives, cached by order like the first two
+                if order not in self._cache:
+                    self._cache[order] = differentiate(self.function, self.variable, order)
+                return self._cache[order]
         except Exception as e:
-            print(f"Error calculating derivative of order {order}: {e}")
+            logger.warning("Error calculating derivative of order %s: %s", order, e)
             return None
     
     def evaluate_derivative(self, order: int, x_value: Union[int, float]) -> Optional[float]:
@@ -109,17 +123,17 @@ class DifferentialCalculator:
             if derivative is None:
                 return None
             
-            # Substitute the value and evaluate
-            result = derivative.subs(self.variable, x_value)
+            # Substitute and evaluate numerically in a single evalf pass
+            result = derivative.evalf(subs={self.variable: x_value})
             
             # Convert to float if possible
             if result.is_real and result.is_finite:
-                return float(result.evalf())
+                return float(result)
             else:
                 return None
                 
         except Exception as e:
-            print(f"Error evaluating derivative of order {order} at x={x_value}: {e}")
+            logger.warning("Error evaluating derivative of order %s at x=%s: %s", order, x_value, e)
             return None
     
     def get_derivative_info(self) -> dict:
@@ -132,19 +146,34 @@ class DifferentialCalculator:
         return {
             'original_function': str(self.function),
             'variable': str(self.variable),
-            'first_derivative': str(self.get_first_derivative()) if self.get_first_derivative() is not None else None,
-            'second_derivative': str(self.get_second_derivative()) if self.get_second_derivative() is not None else None
+            'first_derivative': self._derivative_str(1),
+            'second_derivative': self._derivative_str(2)
         }
     
+    def _derivative_str(self, order: int) -> Optional[str]:
+        """
+        Return the string form of the nth derivative, stringified once per order.
+        
+        Args:
+            order: The order of the derivative
+            
+        Returns:
+            String representation of the derivative, or None if calculation fails
+        """
+        if order not in self._str_cache:
+            derivative = self.get_derivative(order)
+            self._str_cache[order] = str(derivative) if derivative is not None else None
+        return self._str_cache[order]
+    
     def reset_cache(self):
         """
         Reset the cached derivative values.
         
-        This method clears the cached first and second derivatives,
+        This method clears the cached derivatives of every order,
         forcing recalculation on the next call.
         """
-        self._first_derivative = None
-        self._second_derivative = None
+        self._cache.clear()
+        self._str_cache.clear()
     
     def update_function(self, new_function: sp.Expr, new_variable: Optional[Symbol] = None):
         """
@@ -162,6 +191,7 @@ class DifferentialCalculator:
 
 # Utility functions for common derivative operations
 
+@lru_cache(maxsize=256)
 def compute_derivative(expression: str, variable_name: str = 'x', order: int = 1) -> Optional[str]:
     """
     Utility function to compute derivative from string expression.
@@ -177,7 +207,7 @@ def compute_derivative(expression: str, variable_name: str = 'x', order: int = 1
     try:
         # Parse the expression
         var = Symbol(variable_name)
-        func = sp.sympify(expression)
+        func = cached_sympify(expression)
         
         # Create calculator and compute derivative
         calculator = DifferentialCalculator(func, var)
@@ -186,7 +216,7 @@ def compute_derivative(expression: str, variable_name: str = 'x', order: int = 1
         return str(derivative) if derivative is not None else None
         
     except Exception as e:
-        print(f"Error computing derivative: {e}")
+        logger.warning("Error computing derivative: %s", e)
         return None
 
 
@@ -204,15 +234,35 @@ def find_critical_points_numeric(expression: str, variable_name: str = 'x',
     Returns:
         List of critical points as float values
     """
+    # The cached result is an immutable tuple; every caller gets its own list
+    return list(_find_critical_points_cached(expression, variable_name,
+                                             float(domain_start), float(domain_end)))
+
+
+@lru_cache(maxsize=256)
+def _find_critical_points_cached(expression: str, variable_name: str,
+                                 domain_start: float, domain_end: float) -> Tuple[float, ...]:
+    """
+    Find the sorted critical points of an expression within a domain, memoized per arguments.
+    
+    Returns:
+        Tuple of critical points as float values, empty if they cannot be found
+    """
     try:
         var = Symbol(variable_name)
-        func = sp.sympify(expression)
+        func = cached_sympify(expression)
         
         calculator = DifferentialCalculator(func, var)
         first_deriv = calculator.get_first_derivative()
         
         if first_deriv is None:
-            return []
+            return ()
+        
+        # Polynomial derivatives with numeric coefficients: all roots at once
+        real_roots = real_polynomial_roots(first_deriv, var)
+        if real_roots is not None:
+            in_domain = real_roots[(real_roots >= domain_start) & (real_roots <= domain_end)]
+            return tuple(in_domain.tolist())
         
         # Solve first derivative = 0
         critical_points = sp.solve(first_deriv, var)
@@ -221,12 +271,12 @@ def find_critical_points_numeric(expression: str, variable_name: str = 'x',
         real_points = []
         for point in critical_points:
             if point.is_real:
-                val = float(point.evalf())
+                val = float(point)
                 if domain_start <= val <= domain_end:
                     real_points.append(val)
         
-        return sorted(real_points)
+        return tuple(sorted(real_points))
         
     except Exception as e:
-        print(f"Error finding critical points: {e}")
-        return []
+        logger.warning("Error finding critical points: %s", e)
+        return ()
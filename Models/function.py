@@ -11,8 +11,76 @@ from sympy import Symbol, symbols, sympify, solve, limit, diff, oo, zoo, nan
 from sympy.calculus.util import continuous_domain
 from sympy.sets import Interval, Union, FiniteSet, EmptySet
 from sympy.core.relational import Eq
+from collections import OrderedDict
+from functools import cached_property, lru_cache, wraps
 from typing import Dict, List, Tuple, Union, Optional, Any
 import numpy as np
+import copy
+import threading
+
+from Utils.math_utils import cached_sympify, differentiate, real_polynomial_roots
+
+# llvmlite is optional; without it scalar evaluation uses the NumPy callable.
+# Some llvmlite releases fail on import with RuntimeError rather than ImportError
+try:
+    import llvmlite  # noqa: F401
+    from sympy.printing.llvmjitcode import llvm_callable
+except Exception:
+    llvm_callable = None
+
+
+# Denominator magnitude below which a numerator root is treated as a hole
+_HOLE_TOLERANCE = 1e-9
+
+# Points where f(x) and f(-x) are compared before the symbolic symmetry check
+_SYMMETRY_SAMPLES = np.array([0.37, 1.9, 2.3, 4.1, 7.7])
+
+# Results per expression kept by each method shared across analyzers
+_SHARED_RESULTS_SIZE = 256
+
+# Grid sampled by the numeric analysis mode
+_SCAN_RANGE = (-50.0, 50.0)
+_SCAN_SAMPLES = 20000
+
+
+def _shared_across_analyzers(method):
+    """
+    Memoize an analysis method on the analyzed expression, process-wide.
+    
+    SymPy expressions hash and compare structurally, so analyzers of equal
+    functions (the same string again, or parameter values revisited during a
+    sweep) share one result. Each caller receives its own deep copy.
+    """
+    results: "OrderedDict[sp.Expr, Any]" = OrderedDict()
+    lock = threading.Lock()
+    
+    @wraps(method)
+    def wrapper(self):
+        with lock:
+            if self.function in results:
+                results.move_to_end(self.function)
+                return copy.deepcopy(results[self.function])
+        
+        result = method(self)
+        with lock:
+            results[self.function] = copy.deepcopy(result)
+            while len(results) > _SHARED_RESULTS_SIZE:
+                results.popitem(last=False)
+        return result
+    
+    return wrapper
+
+
+@lru_cache(maxsize=64)
+def _symbolic_derivatives(expression: sp.Expr, var: Symbol) -> Tuple[sp.Expr, sp.Expr]:
+    """
+    First and second derivatives of an expression with its parameters left symbolic.
+    
+    Analyzers of the same function with different parameter values share
+    these and only substitute their values into them.
+    """
+    first = differentiate(expression, var)
+    return first, differentiate(first, var)
 
 
 class FunctionAnalyzer:
@@ -24,6 +92,10 @@ class FunctionAnalyzer:
     and monotonicity.
     """
     
+    # Derived results cached on first use; all depend only on self.function
+    _CACHED_RESULTS = ('_d1', '_d2', '_d1_zeros', '_d2_zeros', '_fraction', '_rational_parts',
+                       '_f_neg_x', '_f_num', '_f_llvm', '_d1_num', '_d2_num')
+    
     def __init__(self, func_str: str, parameters: Optional[Dict[str, Union[int, float]]] = None):
         """
         Initialize the FunctionAnalyzer.
@@ -38,6 +110,7 @@ class FunctionAnalyzer:
         self.function = None
         self.original_function = None
         self.param_symbols = {}
+        self._substitutions = {}
         
         try:
             self._parse_function()
@@ -51,43 +124,152 @@ class FunctionAnalyzer:
         Raises:
             ValueError: If the function string is invalid
         """
+        # A new function invalidates everything derived from the previous one
+        for name in self._CACHED_RESULTS:
+            self.__dict__.pop(name, None)
+        
         try:
             if not self.func_str or not isinstance(self.func_str, str):
                 raise ValueError("Function string cannot be empty")
             
-            # Parse the function string
-            self.original_function = sympify(self.func_str)
-            
-            # Replace any x symbols with our defined x symbol
-            x_symbols = [s for s in self.original_function.free_symbols if str(s) == 'x']
-            if x_symbols:
-                for x_sym in x_symbols:
-                    self.original_function = self.original_function.subs(x_sym, self.x)
+            # Parse the function string, binding x to our real symbol during the parse
+            self.original_function = cached_sympify(self.func_str, self.x)
             
-            # Get all symbols in the function
-            all_symbols = self.original_function.free_symbols
+            # Every other free symbol is a parameter
+            self.param_symbols = {
+                str(symbol): symbol for symbol in self.original_function.free_symbols
+                if symbol != self.x
+            }
             
-            # Separate x from parameter symbols
-            for symbol in all_symbols:
-                if str(symbol) == 'x':
-                    continue
-                else:
-                    self.param_symbols[str(symbol)] = symbol
-            
-            # Substitute parameters if provided
-            self.function = self.original_function
-            if self.parameters:
-                substitutions = {}
-                for param_name, param_value in self.parameters.items():
-                    if param_name in self.param_symbols:
-                        substitutions[self.param_symbols[param_name]] = param_value
-                
-                if substitutions:
-                    self.function = self.original_function.subs(substitutions)
+            # Substitute parameters if provided, in one tree traversal
+            self._substitutions = {
+                self.param_symbols[name]: sp.sympify(value)
+                for name, value in self.parameters.items() if name in self.param_symbols
+            }
+            if self._substitutions:
+                self.function = self.original_function.xreplace(self._substitutions)
+            else:
+                self.function = self.original_function
             
         except Exception as e:
             raise ValueError(f"Cannot parse function '{self.func_str}': {e}")
     
+    @cached_property
+    def _d1(self) -> sp.Expr:
+        """First derivative of the function."""
+        return _symbolic_derivatives(self.original_function, self.x)[0].xreplace(self._substitutions)
+    
+    @cached_property
+    def _d2(self) -> sp.Expr:
+        """Second derivative of the function."""
+        return _symbolic_derivatives(self.original_function, self.x)[1].xreplace(self._substitutions)
+    
+    def get_derivatives(self) -> Dict[int, sp.Expr]:
+        """
+        Return the first and second derivatives of the function.
+        
+        Returns:
+            Dictionary mapping the derivative order to its expression
+        """
+        return {1: self._d1, 2: self._d2}
+    
+    @cached_property
+    def _d1_zeros(self) -> Tuple[float, ...]:
+        """Sorted real zeros of the first derivative."""
+        return self._real_zeros(self._d1)
+    
+    @cached_property
+    def _d2_zeros(self) -> Tuple[float, ...]:
+        """Sorted real zeros of the second derivative."""
+        return self._real_zeros(self._d2)
+    
+    @cached_property
+    def _fraction(self) -> Tuple[sp.Expr, sp.Expr]:
+        """Numerator and denominator of the function."""
+        return sp.fraction(self.function)
+    
+    @cached_property
+    def _rational_parts(self) -> Optional[Tuple[sp.Expr, sp.Expr]]:
+        """Factored numerator and denominator, or None if the function is not rational in x."""
+        if not self.function.is_rational_function(self.x):
+            return None
+        numer, denom = self._fraction
+        return sp.factor(numer), sp.factor(denom)
+    
+    def _polynomial_zeros(self, poly_expr: sp.Expr) -> List[sp.Expr]:
+        """
+        Find the zeros of a polynomial in self.x, reading them off its factors.
+        
+        Args:
+            poly_expr: Polynomial in self.x, preferably factored
+            
+        Returns:
+            Distinct zeros, from solve() if roots() cannot find all of them
+        """
+        zeros = sp.roots(poly_expr, self.x)
+        if sum(zeros.values()) < sp.degree(poly_expr, self.x):
+            return solve(poly_expr, self.x)
+        return list(zeros)
+    
+    @staticmethod
+    def _to_float(value: sp.Expr) -> float:
+        """Convert a real SymPy value to float, evaluating at double precision only when needed."""
+        try:
+            return float(value)
+        except TypeError:
+            return float(value.evalf(15))
+    
+    def _real_zeros(self, expr: sp.Expr) -> Tuple[float, ...]:
+        """
+        Solve expr = 0 and keep the real, finite solutions.
+        
+        Args:
+            expr: Expression in self.x
+            
+        Returns:
+            Sorted tuple of solutions, empty if solving fails
+        """
+        # Polynomials with numeric coefficients: all real roots from numpy at once
+        roots = real_polynomial_roots(expr, self.x)
+        if roots is not None:
+            return tuple(roots.tolist())
+        
+        # Rational functions: the same for the numerator, which is far cheaper
+        # than solveset; only other (e.g. transcendental) input is solved
+        zeros = self._rational_real_zeros(expr)
+        if zeros is not None:
+            return tuple(zeros)
+        
+        zeros = []
+        try:
+            for candidate in self._real_solutions(expr):
+                if candidate.is_real and candidate.is_finite:
+                    zeros.append(self._to_float(candidate))
+        except Exception:
+            # No closed form (e.g. x = cos(x)), or infinitely many zeros (e.g.
+            # x**2*sin(x)): a scan over a finite window would pass off a
+            # truncated subset as the complete answer, so none are reported
+            pass
+        return tuple(sorted(zeros))
+    
+    def _real_solutions(self, expr: sp.Expr) -> List[sp.Expr]:
+        """
+        Solve expr = 0 over the reals only, without building complex roots.
+        
+        Uses solveset, or solve() when the solution set is not finite.
+        
+        Args:
+            expr: Expression in self.x
+            
+        Returns:
+            Distinct candidate solutions
+        """
+        solutions = sp.solveset(expr, self.x, domain=sp.S.Reals)
+        if isinstance(solutions, FiniteSet):
+            return list(solutions)
+        return solve(expr, self.x)
+    
+    @_shared_across_analyzers
     def get_domain(self) -> Union[Interval, FiniteSet]:
         """
         Calculate the domain of the function.
@@ -106,36 +288,23 @@ class FunctionAnalyzer:
                 
                 # Check for denominators
                 denominators = []
-                if self.function.is_rational_function(self.x):
-                    numer, denom = sp.fraction(self.function)
+                if self._rational_parts is not None:
+                    numer, denom = self._rational_parts
                     if denom != 1:
                         # Find zeros of denominator
-                        zeros = solve(denom, self.x)
+                        zeros = self._polynomial_zeros(denom)
                         for zero in zeros:
                             if zero.is_real:
                                 domain_restrictions.append(zero)
                 
-                # Check for square roots and even roots
-                for expr in sp.preorder_traversal(self.function):
-                    if expr.is_Pow and expr.exp.is_Rational:
-                        if expr.exp.q % 2 == 0 and expr.exp > 0:  # Even root
-                            # Argument must be non-negative
-                            try:
-                                constraint = solve(expr.base >= 0, self.x)
-                                # This is complex to handle generally
-                            except:
-                                pass
-                    elif hasattr(expr, 'func') and str(expr.func) in ['log', 'ln']:
-                        # Logarithm argument must be positive
-                        try:
-                            constraint = solve(expr.args[0] > 0, self.x)
-                        except:
-                            pass
+                # Even roots and logarithms also restrict the domain, but their
+                # constraints are not handled here (self.function.atoms(sp.Pow, sp.log)
+                # yields exactly those nodes if that is ever added)
                 
                 # If we found restrictions, create domain excluding them
                 if domain_restrictions:
                     intervals = []
-                    restrictions_sorted = sorted([float(r.evalf()) for r in domain_restrictions if r.is_real])
+                    restrictions_sorted = sorted([self._to_float(r) for r in domain_restrictions if r.is_real])
                     
                     if restrictions_sorted:
                         # Add interval before first restriction
@@ -169,23 +338,59 @@ class FunctionAnalyzer:
         
         try:
             # Y-intercept: f(0)
-            y_intercept = self.function.subs(self.x, 0)
+            y_intercept = self.function.xreplace({self.x: sp.S.Zero})
             if y_intercept.is_real and y_intercept.is_finite:
-                result['y_intercept'] = float(y_intercept.evalf())
+                result['y_intercept'] = self._to_float(y_intercept)
         except Exception:
             pass
         
         try:
+            # Rational functions: numeric roots of the numerator, without the denominator zeros
+            x_intercepts = self._rational_real_zeros()
+            if x_intercepts is not None:
+                result['x_intercepts'] = x_intercepts
+                return result
+            
             # X-intercepts: solve f(x) = 0
             x_intercepts = solve(self.function, self.x)
             for intercept in x_intercepts:
                 if intercept.is_real and intercept.is_finite:
-                    result['x_intercepts'].append(float(intercept.evalf()))
+                    result['x_intercepts'].append(self._to_float(intercept))
         except Exception:
             pass
         
         return result
     
+    def _rational_real_zeros(self, expr: Optional[sp.Expr] = None) -> Optional[List[float]]:
+        """
+        Find the real zeros of a rational function with numeric coefficients.
+        
+        Roots of the numerator where the denominator also vanishes (holes) are
+        not zeros of the function and are dropped, as solve() does.
+        
+        Args:
+            expr: Expression in self.x; the function itself by default
+        
+        Returns:
+            Sorted zeros, or None if expr is not such a rational function
+        """
+        if expr is None:
+            expr = self.function
+        if expr.free_symbols - {self.x} or not expr.is_rational_function(self.x):
+            return None
+        
+        numer, denom = self._fraction if expr is self.function else sp.fraction(sp.together(expr))
+        roots = real_polynomial_roots(numer, self.x)
+        if roots is None:
+            return None
+        if roots.size == 0:
+            return []
+        
+        with np.errstate(all='ignore'):
+            denom_values = np.broadcast_to(sp.lambdify(self.x, denom, modules='numpy')(roots), roots.shape)
+        return roots[np.abs(denom_values.astype(float)) > _HOLE_TOLERANCE].tolist()
+    
+    @_shared_across_analyzers
     def get_symmetry(self) -> str:
         """
         Determine if the function is even, odd, or neither.
@@ -194,21 +399,120 @@ class FunctionAnalyzer:
             'even', 'odd', or 'neither'
         """
         try:
+            # Rule out each case numerically first; simplify only confirms the rest
+            maybe_even, maybe_odd = self._numeric_symmetry()
+            if not (maybe_even or maybe_odd):
+                return 'neither'
+            
             f_x = self.function
-            f_neg_x = self.function.subs(self.x, -self.x)
+            f_neg_x = self._f_neg_x
             
             # Check if f(-x) = f(x) (even function)
-            if sp.simplify(f_neg_x - f_x) == 0:
+            if maybe_even and self._vanishes(f_neg_x - f_x):
                 return 'even'
             
             # Check if f(-x) = -f(x) (odd function)
-            if sp.simplify(f_neg_x + f_x) == 0:
+            if maybe_odd and self._vanishes(f_neg_x + f_x):
                 return 'odd'
             
             return 'neither'
         except Exception:
             return 'neither'
     
+    @cached_property
+    def _f_neg_x(self) -> sp.Expr:
+        """The function reflected in the y-axis, f(-x)."""
+        return self.function.xreplace({self.x: -self.x})
+    
+    @staticmethod
+    def _vanishes(expr: sp.Expr) -> bool:
+        """
+        Check whether an expression is identically zero.
+        
+        Expanding settles polynomial and most rational cases cheaply;
+        simplify only runs on what expand cannot cancel.
+        """
+        expanded = sp.expand(expr)
+        if expanded == 0:
+            return True
+        return sp.simplify(expanded) == 0
+    
+    @cached_property
+    def _f_num(self):
+        """Function compiled into a NumPy callable of x, with repeated subexpressions computed once."""
+        return sp.lambdify(self.x, self.function, modules='numpy', cse=True)
+    
+    @cached_property
+    def _f_llvm(self):
+        """Function JIT-compiled by LLVM into a native scalar callable, or None if unavailable."""
+        if llvm_callable is None or self.function.free_symbols - {self.x}:
+            return None
+        try:
+            return llvm_callable([self.x], self.function)
+        except Exception:
+            return None
+    
+    def evaluate(self, xs):
+        """
+        Evaluate the function numerically.
+        
+        A single x value goes through the LLVM-compiled callable when llvmlite
+        is installed; arrays (and scalars otherwise) use the NumPy callable.
+        
+        Args:
+            xs: x value or array of x values
+            
+        Returns:
+            f(xs) with the shape of xs, NaN or inf where f is undefined
+        """
+        if np.ndim(xs) == 0 and self._f_llvm is not None:
+            try:
+                return float(self._f_llvm(float(xs)))
+            except Exception:
+                pass
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(self._f_num(xs), np.shape(xs))
+    
+    def evaluate_array(self, xs) -> np.ndarray:
+        """
+        Evaluate the function on many x values in one vectorized call.
+        
+        Args:
+            xs: Array-like of x values
+            
+        Returns:
+            Float array shaped like xs, NaN where f is undefined, complex or infinite
+        """
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            values = np.asarray(self.evaluate(xs))
+            if np.iscomplexobj(values):
+                values = np.where(values.imag == 0, values.real, np.nan)
+            values = values.astype(float)
+        return np.where(np.isfinite(values), values, np.nan)
+    
+    def _numeric_symmetry(self) -> Tuple[bool, bool]:
+        """
+        Compare f(x) with f(-x) at a few sample points.
+        
+        Returns:
+            (maybe_even, maybe_odd); a case is False only if some sample where
+            both values are finite contradicts it, so it can skip simplify safely
+        """
+        try:
+            with np.errstate(all='ignore'):
+                f_x = np.broadcast_to(self._f_num(_SYMMETRY_SAMPLES), _SYMMETRY_SAMPLES.shape)
+                f_neg_x = np.broadcast_to(self._f_num(-_SYMMETRY_SAMPLES), _SYMMETRY_SAMPLES.shape)
+                usable = np.isfinite(f_x) & np.isfinite(f_neg_x)
+        except Exception:
+            return True, True
+        
+        if not usable.any():
+            return True, True
+        f_x, f_neg_x = f_x[usable], f_neg_x[usable]
+        return bool(np.allclose(f_neg_x, f_x)), bool(np.allclose(f_neg_x, -f_x))
+    
+    @_shared_across_analyzers
     def get_asymptotes(self) -> Dict[str, List[Union[float, str]]]:
         """
         Find vertical, horizontal, and oblique asymptotes.
@@ -218,14 +522,23 @@ class FunctionAnalyzer:
         """
         result = {'vertical': [], 'horizontal': [], 'oblique': []}
         
+        # A constant function is its own horizontal asymptote; no limits needed
+        if self.x not in self.function.free_symbols:
+            if self.function.is_real and self.function.is_finite:
+                result['horizontal'].append(self._to_float(self.function))
+            return result
+        
         try:
             # Vertical asymptotes: points where function approaches infinity
-            if self.function.is_rational_function(self.x):
-                numer, denom = sp.fraction(self.function)
+            vertical = self._rational_vertical_asymptotes()
+            if vertical is not None:
+                result['vertical'] = vertical
+            elif self._rational_parts is not None:
+                numer, denom = self._rational_parts
                 if denom != 1:
                     # Find zeros of denominator that are not zeros of numerator
-                    denom_zeros = solve(denom, self.x)
-                    numer_zeros = solve(numer, self.x)
+                    denom_zeros = self._polynomial_zeros(denom)
+                    numer_zeros = self._polynomial_zeros(numer)
                     
                     for zero in denom_zeros:
                         if zero.is_real and zero not in numer_zeros:
@@ -234,24 +547,33 @@ class FunctionAnalyzer:
                                 left_limit = limit(self.function, self.x, zero, '-')
                                 right_limit = limit(self.function, self.x, zero, '+')
                                 if left_limit in [oo, -oo] or right_limit in [oo, -oo]:
-                                    result['vertical'].append(float(zero.evalf()))
+                                    result['vertical'].append(self._to_float(zero))
                             except:
-                                result['vertical'].append(float(zero.evalf()))
+                                result['vertical'].append(self._to_float(zero))
         except Exception:
             pass
         
+        # Rational functions: both kinds follow from the leading terms, no limits needed
+        try:
+            end_behavior = self._rational_end_behavior()
+        except Exception:
+            end_behavior = None
+        if end_behavior is not None:
+            result['horizontal'], result['oblique'] = end_behavior
+            return result
+        
         try:
             # Horizontal asymptotes: limits as x approaches infinity
             limit_pos_inf = limit(self.function, self.x, oo)
             limit_neg_inf = limit(self.function, self.x, -oo)
             
             if limit_pos_inf.is_finite and limit_pos_inf.is_real:
-                y_val = float(limit_pos_inf.evalf())
+                y_val = self._to_float(limit_pos_inf)
                 if y_val not in result['horizontal']:
                     result['horizontal'].append(y_val)
             
             if limit_neg_inf.is_finite and limit_neg_inf.is_real:
-                y_val = float(limit_neg_inf.evalf())
+                y_val = self._to_float(limit_neg_inf)
                 if y_val not in result['horizontal']:
                     result['horizontal'].append(y_val)
         except Exception:
@@ -265,12 +587,57 @@ class FunctionAnalyzer:
                 if m.is_finite and m.is_real and m != 0:
                     b = limit(self.function - m * self.x, self.x, oo)
                     if b.is_finite and b.is_real:
-                        result['oblique'].append(f"y = {float(m.evalf())}*x + {float(b.evalf())}")
+                        result['oblique'].append(f"y = {self._to_float(m)}*x + {self._to_float(b)}")
         except Exception:
             pass
         
         return result
     
+    def _rational_vertical_asymptotes(self) -> Optional[List[float]]:
+        """
+        Find the vertical asymptotes of a rational function with numeric coefficients.
+        
+        Once common factors are cancelled, every real zero of the denominator
+        is a pole, so no limits are needed.
+        
+        Returns:
+            Sorted x-coordinates, or None if the function is not such a rational function
+        """
+        if self._rational_parts is None or self.function.free_symbols - {self.x}:
+            return None
+        
+        _, denom = sp.fraction(sp.cancel(self.function))
+        poles = real_polynomial_roots(denom, self.x)
+        return None if poles is None else poles.tolist()
+    
+    def _rational_end_behavior(self) -> Optional[Tuple[List[float], List[str]]]:
+        """
+        Find the horizontal or oblique asymptote of a rational function with
+        numeric coefficients from the degrees and leading coefficients of its
+        numerator and denominator.
+        
+        Returns:
+            (horizontal, oblique) asymptote lists, or None if the function is
+            not such a rational function
+        """
+        if self._rational_parts is None or self.function.free_symbols - {self.x}:
+            return None
+        
+        try:
+            numer, denom = (sp.Poly(part, self.x) for part in self._rational_parts)
+        except sp.PolynomialError:
+            return None
+        
+        if numer.degree() < denom.degree():
+            return [0.0], []
+        if numer.degree() == denom.degree():
+            return [float(numer.LC() / denom.LC())], []
+        if numer.degree() == denom.degree() + 1:
+            # The linear quotient of the division is the asymptote
+            m, b = numer.quo(denom).all_coeffs()
+            return [], [f"y = {float(m)}*x + {float(b)}"]
+        return [], []
+    
     def get_critical_points(self) -> List[float]:
         """
         Find critical points where the first derivative is zero or undefined.
@@ -278,26 +645,13 @@ class FunctionAnalyzer:
         Returns:
             List of x-coordinates of critical points
         """
-        critical_points = []
-        
         try:
-            # Calculate first derivative
-            first_derivative = diff(self.function, self.x)
-            
-            # Find zeros of the first derivative
-            critical_candidates = solve(first_derivative, self.x)
-            
-            for candidate in critical_candidates:
-                if candidate.is_real and candidate.is_finite:
-                    critical_points.append(float(candidate.evalf()))
-            
-            # Find points where derivative is undefined (but function is defined)
-            # This is more complex and may require additional analysis
-            
+            # Zeros of the first derivative (computed once per analyzer)
+            # Points where the derivative is undefined (but the function is
+            # defined) are not detected; that needs additional analysis
+            return list(self._d1_zeros)
         except Exception:
-            pass
-        
-        return sorted(critical_points)
+            return []
     
     def get_inflection_points(self) -> List[float]:
         """
@@ -307,172 +661,225 @@ class FunctionAnalyzer:
         Returns:
             List of x-coordinates of inflection points
         """
-        inflection_points = []
-        
         try:
-            # Calculate second derivative
-            second_derivative = diff(self.function, self.x, 2)
-            
-            # Find zeros of the second derivative
-            inflection_candidates = solve(second_derivative, self.x)
-            
-            for candidate in inflection_candidates:
-                if candidate.is_real and candidate.is_finite:
-                    # Verify that concavity actually changes
-                    # This is a simplified check
-                    inflection_points.append(float(candidate.evalf()))
-        
+            # Zeros of the second derivative (computed once per analyzer);
+            # whether concavity actually changes there is not verified
+            return list(self._d2_zeros)
         except Exception:
-            pass
-        
-        return sorted(inflection_points)
+            return []
     
-    def get_monotonicity(self) -> Dict[str, List[Tuple[float, float]]]:
+    def get_monotonicity(self, critical_points: Optional[List[float]] = None) -> Dict[str, List[Tuple[float, float]]]:
         """
         Determine intervals where the function is increasing or decreasing.
         
+        Args:
+            critical_points: Sorted critical points if already computed
+            
         Returns:
             Dictionary with 'increasing' and 'decreasing' interval lists
         """
         result = {'increasing': [], 'decreasing': []}
         
         try:
-            # Get first derivative
-            first_derivative = diff(self.function, self.x)
-            
-            # Get critical points
-            critical_points = self.get_critical_points()
-            
-            # Test points between critical points
-            test_points = []
-            domain = self.get_domain()
-            
+            # Sign of the first derivative between critical points, which
+            # get_critical_points already returns sorted
+            if critical_points is None:
+                critical_points = self.get_critical_points()
             if critical_points:
-                # Add test points
-                sorted_criticals = sorted(critical_points)
-                
-                # Before first critical point
-                test_points.append(sorted_criticals[0] - 1)
-                
-                # Between critical points
-                for i in range(len(sorted_criticals) - 1):
-                    test_points.append((sorted_criticals[i] + sorted_criticals[i+1]) / 2)
-                
-                # After last critical point
-                test_points.append(sorted_criticals[-1] + 1)
-                
-                # Check sign of derivative at test points
-                for i, test_point in enumerate(test_points):
-                    try:
-                        derivative_value = first_derivative.subs(self.x, test_point)
-                        if derivative_value.is_real:
-                            if derivative_value > 0:
-                                if i == 0:
-                                    result['increasing'].append((-float('inf'), sorted_criticals[0]))
-                                elif i == len(test_points) - 1:
-                                    result['increasing'].append((sorted_criticals[-1], float('inf')))
-                                else:
-                                    result['increasing'].append((sorted_criticals[i-1], sorted_criticals[i]))
-                            elif derivative_value < 0:
-                                if i == 0:
-                                    result['decreasing'].append((-float('inf'), sorted_criticals[0]))
-                                elif i == len(test_points) - 1:
-                                    result['decreasing'].append((sorted_criticals[-1], float('inf')))
-                                else:
-                                    result['decreasing'].append((sorted_criticals[i-1], sorted_criticals[i]))
-                    except:
-                        continue
-        
+                self._add_sign_intervals(self._d1_num, critical_points, result,
+                                         'increasing', 'decreasing')
         except Exception:
             pass
         
         return result
     
-    def get_concavity(self) -> Dict[str, List[Tuple[float, float]]]:
+    def get_concavity(self, inflection_points: Optional[List[float]] = None) -> Dict[str, List[Tuple[float, float]]]:
         """
         Determine intervals where the function is concave up or concave down.
         
+        Args:
+            inflection_points: Sorted inflection points if already computed
+            
         Returns:
             Dictionary with 'concave_up' and 'concave_down' interval lists
         """
         result = {'concave_up': [], 'concave_down': []}
         
         try:
-            # Get second derivative
-            second_derivative = diff(self.function, self.x, 2)
-            
-            # Get inflection points
-            inflection_points = self.get_inflection_points()
+            # Sign of the second derivative between inflection points
+            # (a single test point at 0 when there are none); they come
+            # sorted from get_inflection_points
+            if inflection_points is None:
+                inflection_points = self.get_inflection_points()
+            self._add_sign_intervals(self._d2_num, inflection_points, result,
+                                     'concave_up', 'concave_down')
+        except Exception:
+            pass
+        
+        return result
+    
+    @cached_property
+    def _d1_num(self):
+        """First derivative compiled into a NumPy callable of x, with repeated subexpressions computed once."""
+        return sp.lambdify(self.x, self._d1, modules='numpy', cse=True)
+    
+    @cached_property
+    def _d2_num(self):
+        """Second derivative compiled into a NumPy callable of x, with repeated subexpressions computed once."""
+        return sp.lambdify(self.x, self._d2, modules='numpy', cse=True)
+    
+    @staticmethod
+    def _add_sign_intervals(derivative_num, boundaries: List[float], result: Dict[str, list],
+                            positive_key: str, negative_key: str):
+        """
+        Classify the intervals between boundaries by the sign of a derivative.
+        
+        The derivative is evaluated at one test point per interval, all in a
+        single vectorized call. Intervals where it is not real and finite,
+        or cannot be evaluated, are left out.
+        
+        Args:
+            derivative_num: NumPy callable of the derivative
+            boundaries: Sorted points splitting the real line
+            result: Dictionary receiving the (start, end) intervals
+            positive_key: Key of the intervals where the derivative is positive
+            negative_key: Key of the intervals where the derivative is negative
+        """
+        if boundaries:
+            c = np.asarray(boundaries, dtype=float)
+            xs = np.concatenate(([c[0] - 1.0], 0.5 * (c[:-1] + c[1:]), [c[-1] + 1.0]))
+        else:
+            xs = np.zeros(1)
+        
+        try:
+            with np.errstate(all='ignore'):
+                values = np.asarray(derivative_num(xs))
+                if np.iscomplexobj(values):
+                    values = np.where(values.imag == 0, values.real, np.nan)
+                values = np.broadcast_to(values, xs.shape).astype(float)
+                signs = np.sign(np.where(np.isfinite(values), values, np.nan))
+        except Exception:
+            return
+        
+        # Interval i runs between edges i and i + 1; pick them out by sign with masks
+        edges = np.concatenate(([-np.inf], np.asarray(boundaries, dtype=float), [np.inf]))
+        starts, ends = edges[:-1], edges[1:]
+        for key, mask in ((positive_key, signs > 0), (negative_key, signs < 0)):
+            result[key].extend(zip(starts[mask].tolist(), ends[mask].tolist()))
+    
+    def numeric_scan(self, x_min: float = _SCAN_RANGE[0], x_max: float = _SCAN_RANGE[1],
+                     samples: int = _SCAN_SAMPLES) -> Dict[str, Any]:
+        """
+        Locate intercepts, critical and inflection points from sign changes of
+        f, f' and f'' on a dense grid, with no symbolic solving.
+        
+        Zeros are refined by linear interpolation. Only zeros inside the
+        range where the sign changes are found (a double root such as x**2
+        at 0 is missed), so this is meant for fast interactive updates.
+        
+        Args:
+            x_min: Start of the sampled range
+            x_max: End of the sampled range
+            samples: Number of grid points
             
-            # Test points between inflection points
-            test_points = []
+        Returns:
+            Dictionary with 'intercepts', 'critical_points', 'inflection_points',
+            'monotonicity' and 'concavity' in the format of the symbolic methods
+        """
+        xs = np.linspace(x_min, x_max, samples)
+        x_intercepts = self._scan_zeros(self._f_num, xs)
+        critical_points = self._scan_zeros(self._d1_num, xs)
+        inflection_points = self._scan_zeros(self._d2_num, xs)
+        
+        y_intercept = self.evaluate_array([0.0])[0]
+        
+        monotonicity = {'increasing': [], 'decreasing': []}
+        if critical_points:
+            self._add_sign_intervals(self._d1_num, critical_points, monotonicity,
+                                     'increasing', 'decreasing')
+        concavity = {'concave_up': [], 'concave_down': []}
+        self._add_sign_intervals(self._d2_num, inflection_points, concavity,
+                                 'concave_up', 'concave_down')
+        
+        return {
+            'intercepts': {
+                'x_intercepts': x_intercepts,
+                'y_intercept': float(y_intercept) if np.isfinite(y_intercept) else None
+            },
+            'critical_points': critical_points,
+            'inflection_points': inflection_points,
+            'monotonicity': monotonicity,
+            'concavity': concavity
+        }
+    
+    @staticmethod
+    def _scan_zeros(func_num, xs: np.ndarray) -> List[float]:
+        """
+        Find the zeros of a NumPy callable from the sign changes of its samples.
+        
+        A sign change across a pole is not a zero; it is told apart because
+        the function does not get smaller at the interpolated point.
+        
+        Args:
+            func_num: NumPy callable of x
+            xs: Sorted sample points
             
-            if inflection_points:
-                sorted_inflections = sorted(inflection_points)
-                
-                # Before first inflection point
-                test_points.append(sorted_inflections[0] - 1)
-                
-                # Between inflection points
-                for i in range(len(sorted_inflections) - 1):
-                    test_points.append((sorted_inflections[i] + sorted_inflections[i+1]) / 2)
+        Returns:
+            Sorted zeros, empty if the function cannot be evaluated
+        """
+        try:
+            with np.errstate(all='ignore'):
+                values = np.asarray(func_num(xs))
+                if np.iscomplexobj(values):
+                    values = np.where(values.imag == 0, values.real, np.nan)
+                values = np.broadcast_to(values, xs.shape).astype(float)
                 
-                # After last inflection point
-                test_points.append(sorted_inflections[-1] + 1)
+                lo, hi = values[:-1], values[1:]
+                brackets = np.flatnonzero(np.isfinite(lo) & np.isfinite(hi) & (lo * hi < 0))
+                t = lo[brackets] / (lo[brackets] - hi[brackets])
+                estimates = xs[brackets] + t * (xs[brackets + 1] - xs[brackets])
                 
-                # Check sign of second derivative at test points
-                for i, test_point in enumerate(test_points):
-                    try:
-                        second_deriv_value = second_derivative.subs(self.x, test_point)
-                        if second_deriv_value.is_real:
-                            if second_deriv_value > 0:
-                                if i == 0:
-                                    result['concave_up'].append((-float('inf'), sorted_inflections[0]))
-                                elif i == len(test_points) - 1:
-                                    result['concave_up'].append((sorted_inflections[-1], float('inf')))
-                                else:
-                                    result['concave_up'].append((sorted_inflections[i-1], sorted_inflections[i]))
-                            elif second_deriv_value < 0:
-                                if i == 0:
-                                    result['concave_down'].append((-float('inf'), sorted_inflections[0]))
-                                elif i == len(test_points) - 1:
-                                    result['concave_down'].append((sorted_inflections[-1], float('inf')))
-                                else:
-                                    result['concave_down'].append((sorted_inflections[i-1], sorted_inflections[i]))
-                    except:
-                        continue
-            else:
-                # No inflection points, test one point
-                try:
-                    second_deriv_value = second_derivative.subs(self.x, 0)
-                    if second_deriv_value.is_real:
-                        if second_deriv_value > 0:
-                            result['concave_up'].append((-float('inf'), float('inf')))
-                        elif second_deriv_value < 0:
-                            result['concave_down'].append((-float('inf'), float('inf')))
-                except:
-                    pass
-        
+                at_estimates = np.broadcast_to(np.asarray(func_num(estimates), dtype=float), estimates.shape)
+                smaller = np.abs(at_estimates) <= np.minimum(np.abs(lo[brackets]), np.abs(hi[brackets]))
+                # Samples landing exactly on a zero (unless the function is identically zero)
+                exact = xs[values == 0] if np.any(values != 0) else xs[:0]
         except Exception:
-            pass
+            return []
         
-        return result
+        return np.sort(np.concatenate((estimates[smaller], exact))).tolist()
     
-    def analyze_all(self) -> Dict[str, Any]:
+    def analyze_all(self, mode: str = 'symbolic') -> Dict[str, Any]:
         """
         Perform complete analysis of the function.
         
+        Args:
+            mode: 'symbolic' for exact results, or 'numeric' to take intercepts,
+                critical/inflection points and the intervals from numeric_scan
+        
         Returns:
             Dictionary containing all analysis results
         """
+        if mode == 'numeric':
+            return {
+                'function': str(self.function),
+                'domain': str(self.get_domain()),
+                'symmetry': self.get_symmetry(),
+                'asymptotes': self.get_asymptotes(),
+                **self.numeric_scan()
+            }
+        
+        critical_points = self.get_critical_points()
+        inflection_points = self.get_inflection_points()
+        
+        # Monotonicity and concavity are built from the points found above
         return {
             'function': str(self.function),
             'domain': str(self.get_domain()),
             'intercepts': self.get_intercepts(),
             'symmetry': self.get_symmetry(),
             'asymptotes': self.get_asymptotes(),
-            'critical_points': self.get_critical_points(),
-            'inflection_points': self.get_inflection_points(),
-            'monotonicity': self.get_monotonicity(),
-            'concavity': self.get_concavity()
+            'critical_points': critical_points,
+            'inflection_points': inflection_points,
+            'monotonicity': self.get_monotonicity(critical_points),
+            'concavity': self.get_concavity(inflection_points)
         }
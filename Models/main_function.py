@@ -7,10 +7,16 @@ and DifferentialCalculator classes.
 """
 
 import sympy as sp
+import numpy as np
 from typing import Dict, Optional, Union, Any
+import copy
+import logging
 import sys
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import partial
 
 # Add the project root to the path to import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,6 +26,16 @@ from Models.differential import DifferentialCalculator
 from Utils.math_utils import is_real_number, evaluate_expression
 
 
+# Analysis errors are logged, not printed; applications decide where they go
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Completed analyses by (function string, sorted parameter items), least recently used first
+_ANALYSIS_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 128
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+
 class MainFunctionProcessor:
     """
     Main processor for comprehensive mathematical function analysis.
@@ -40,6 +56,7 @@ class MainFunctionProcessor:
         self.parameters = parameters or {}
         self.function_analyzer = None
         self.differential_calculator = None
+        self._parsed_str = None
         self.x = sp.Symbol('x', real=True)
         
     def _initialize_analyzers(self) -> bool:
@@ -53,16 +70,23 @@ class MainFunctionProcessor:
             # Initialize FunctionAnalyzer
             self.function_analyzer = FunctionAnalyzer(self.func_str, self.parameters)
             
-            # Get the parsed function from FunctionAnalyzer
+            # Get the parsed function from FunctionAnalyzer, stringified once for every stage
             sympy_function = self.function_analyzer.function
+            self._parsed_str = str(sympy_function)
+            
+            # Derivatives the analyzer computes anyway are shared, not recomputed
+            try:
+                derivatives = self.function_analyzer.get_derivatives()
+            except Exception:
+                derivatives = None
             
             # Initialize DifferentialCalculator
-            self.differential_calculator = DifferentialCalculator(sympy_function, self.x)
+            self.differential_calculator = DifferentialCalculator(sympy_function, self.x, derivatives)
             
             return True
             
         except Exception as e:
-            print(f"Error initializing analyzers: {e}")
+            logger.warning("Error initializing analyzers: %s", e)
             return False
     
     def _safe_analysis_call(self, method_name: str, analyzer_method) -> Any:
@@ -80,7 +104,7 @@ class MainFunctionProcessor:
             return analyzer_method()
         except Exception as e:
             error_msg = f"Error in {method_name}: {str(e)}"
-            print(error_msg)
+            logger.warning("Error in %s: %s", method_name, e)
             return {"error": error_msg}
     
     def _format_derivative_result(self, derivative: Optional[sp.Expr]) -> Union[str, Dict[str, str]]:
@@ -144,56 +168,52 @@ class MainFunctionProcessor:
         # Basic function information
         analysis['function_string'] = self.func_str
         analysis['parameters'] = self.parameters
-        analysis['parsed_function'] = str(self.function_analyzer.function)
+        analysis['parsed_function'] = self._parsed_str
+        
+        analyzer = self.function_analyzer
         
         # Domain analysis
-        analysis['domain'] = self._safe_analysis_call(
-            "domain_analysis",
-            self.function_analyzer.get_domain
-        )
+        analysis['domain'] = self._safe_analysis_call("domain_analysis", analyzer.get_domain)
         if not isinstance(analysis['domain'], dict) or 'error' not in analysis['domain']:
             analysis['domain'] = str(analysis['domain'])
         
         # Intercepts
-        analysis['intercepts'] = self._safe_analysis_call(
-            "intercepts_analysis",
-            self.function_analyzer.get_intercepts
-        )
+        analysis['intercepts'] = self._safe_analysis_call("intercepts_analysis", analyzer.get_intercepts)
         
         # Symmetry
-        analysis['symmetry'] = self._safe_analysis_call(
-            "symmetry_analysis",
-            self.function_analyzer.get_symmetry
-        )
+        analysis['symmetry'] = self._safe_analysis_call("symmetry_analysis", analyzer.get_symmetry)
         
         # Asymptotes
-        analysis['asymptotes'] = self._safe_analysis_call(
-            "asymptotes_analysis",
-            self.function_analyzer.get_asymptotes
-        )
+        analysis['asymptotes'] = self._safe_analysis_call("asymptotes_analysis", analyzer.get_asymptotes)
         
         # Critical points
         analysis['critical_points'] = self._safe_analysis_call(
             "critical_points_analysis",
-            self.function_analyzer.get_critical_points
+            analyzer.get_critical_points
         )
         
         # Inflection points
         analysis['inflection_points'] = self._safe_analysis_call(
             "inflection_points_analysis",
-            self.function_analyzer.get_inflection_points
+            analyzer.get_inflection_points
         )
         
+        # Monotonicity and concavity reuse the points found above
+        critical_points = analysis['critical_points']
+        inflection_points = analysis['inflection_points']
+        
         # Monotonicity
         analysis['monotonicity'] = self._safe_analysis_call(
             "monotonicity_analysis",
-            self.function_analyzer.get_monotonicity
+            partial(analyzer.get_monotonicity,
+                    critical_points if isinstance(critical_points, list) else None)
         )
         
         # Concavity
         analysis['concavity'] = self._safe_analysis_call(
             "concavity_analysis",
-            self.function_analyzer.get_concavity
+            partial(analyzer.get_concavity,
+                    inflection_points if isinstance(inflection_points, list) else None)
         )
         
         return analysis
@@ -209,14 +229,24 @@ class MainFunctionProcessor:
             Dictionary mapping x-values to function values
         """
         evaluations = {}
+        real_points = [point for point in points if is_real_number(point)]
         
-        for point in points:
-            if is_real_number(point):
-                try:
-                    value = evaluate_expression(self.func_str, point, self.parameters)
-                    evaluations[str(point)] = value
-                except Exception as e:
-                    evaluations[str(point)] = f"Error: {str(e)}"
+        # All points in one vectorized call of the compiled function
+        try:
+            # Adding 0.0 turns IEEE negative zero into 0.0, as SymPy reports it
+            values = self.function_analyzer.evaluate_array(real_points) + 0.0
+            for point, value in zip(real_points, values.tolist()):
+                evaluations[str(point)] = value if np.isfinite(value) else None
+            return evaluations
+        except Exception:
+            pass
+        
+        for point in real_points:
+            try:
+                value = evaluate_expression(self.func_str, point, self.parameters)
+                evaluations[str(point)] = value
+            except Exception as e:
+                evaluations[str(point)] = f"Error: {str(e)}"
         
         return evaluations
     
@@ -230,30 +260,68 @@ class MainFunctionProcessor:
         Returns:
             Enhanced analysis dictionary
         """
+        groups = []
+        
         # Evaluate function at critical points
         if 'critical_points' in analysis and isinstance(analysis['critical_points'], list):
-            analysis['critical_points_values'] = self._evaluate_function_at_points(
-                analysis['critical_points']
-            )
+            groups.append(('critical_points_values', analysis['critical_points']))
         
         # Evaluate function at inflection points
         if 'inflection_points' in analysis and isinstance(analysis['inflection_points'], list):
-            analysis['inflection_points_values'] = self._evaluate_function_at_points(
-                analysis['inflection_points']
-            )
+            groups.append(('inflection_points_values', analysis['inflection_points']))
         
         # Add some sample function values
         sample_points = [-2, -1, 0, 1, 2]
-        analysis['sample_evaluations'] = self._evaluate_function_at_points(sample_points)
+        groups.append(('sample_evaluations', sample_points))
+        
+        # Evaluate every group in one call, then split the values back by group
+        evaluations = self._evaluate_function_at_points(
+            [point for _, points in groups for point in points]
+        )
+        for key, points in groups:
+            analysis[key] = {
+                str(point): evaluations[str(point)] for point in points if str(point) in evaluations
+            }
         
         return analysis
     
-    def analyze_function(self) -> Dict[str, Any]:
+    def analyze_function(self, include_timestamp: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive function analysis.
         
         This method coordinates all analysis components and returns a structured
-        dictionary containing complete function analysis results.
+        dictionary containing complete function analysis results. Completed
+        analyses are remembered per function string and parameter values, and
+        callers always receive their own copy.
+        
+        Args:
+            include_timestamp: Whether to add an 'analysis_timestamp' of this call
+        
+        Returns:
+            Dictionary containing comprehensive analysis results or error information
+        """
+        key = (self.func_str, tuple(sorted(self.parameters.items())))
+        with _ANALYSIS_CACHE_LOCK:
+            cached = _ANALYSIS_CACHE.get(key)
+            if cached is not None:
+                _ANALYSIS_CACHE.move_to_end(key)
+        if cached is not None:
+            analysis = copy.deepcopy(cached)
+        else:
+            analysis = self._run_analysis()
+            if analysis.get('analysis_status') == 'completed':
+                with _ANALYSIS_CACHE_LOCK:
+                    _ANALYSIS_CACHE[key] = copy.deepcopy(analysis)
+                    while len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                        _ANALYSIS_CACHE.popitem(last=False)
+        
+        if include_timestamp:
+            analysis['analysis_timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return analysis
+    
+    def _run_analysis(self) -> Dict[str, Any]:
+        """
+        Run every analysis stage and combine the results.
         
         Returns:
             Dictionary containing comprehensive analysis results or error information
@@ -268,23 +336,16 @@ class MainFunctionProcessor:
                 }
             
             # Perform function analysis
-            function_analysis = self._get_function_analysis()
-            
-            # Perform derivative analysis
-            derivative_analysis = self._get_derivative_analysis()
+            complete_analysis = self._get_function_analysis()
             
-            # Combine results
-            complete_analysis = {
-                **function_analysis,
-                **derivative_analysis
-            }
+            # Perform derivative analysis, adding its results in place
+            complete_analysis.update(self._get_derivative_analysis())
             
             # Add additional analysis
             complete_analysis = self._add_additional_analysis(complete_analysis)
             
             # Add metadata
             complete_analysis['analysis_status'] = 'completed'
-            complete_analysis['analysis_timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             return complete_analysis
             
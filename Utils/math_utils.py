@@ -5,9 +5,42 @@ This module provides helper functions for mathematical operations,
 expression evaluation, and number validation.
 """
 
+import math
+import re
+from fractions import Fraction
+import mpmath
 import sympy as sp
 import numpy as np
-from typing import Union, Dict, Any, Optional
+from functools import lru_cache, partial
+from typing import Union, Dict, Any, Optional, Tuple
+
+# SymEngine is optional; without it derivatives are computed by SymPy
+try:
+    import symengine as _se
+except ImportError:
+    _se = None
+
+
+# Tolerances for accepting a numeric polynomial root as real, and for merging repeated roots
+_IMAG_TOLERANCE = 1e-7
+_ROOT_MERGE_TOLERANCE = 1e-6
+
+# Largest denominator of the rational values numeric roots are snapped to
+_SNAP_DENOMINATOR = 1000
+
+# Working precision (decimal digits) of the Newton steps polishing irrational roots
+_REFINE_DPS = 40
+
+# Decimal number strings, the only ones is_real_number passes to float()
+_NUMERIC_RE = re.compile(r'\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*')
+
+# is_real_number checks for the exact types it sees most; other types take the general path
+_REAL_NUMBER_CHECKS = {
+    int: lambda value: True,
+    bool: lambda value: True,
+    float: math.isfinite,
+    np.float64: math.isfinite
+}
 
 
 def is_real_number(value: Any) -> bool:
@@ -20,18 +53,22 @@ def is_real_number(value: Any) -> bool:
     Returns:
         bool: True if the value is a real number, False otherwise
     """
+    # Plain Python and NumPy scalars: one dict lookup and a single C call
+    check = _REAL_NUMBER_CHECKS.get(type(value))
+    if check is not None:
+        return check(value)
+    
     try:
         # Check if it's already a number
         if isinstance(value, (int, float)):
             # Check for NaN and infinity
             if isinstance(value, float):
-                return not (np.isnan(value) or np.isinf(value))
+                return math.isfinite(value)
             return True
         
-        # Try to convert string to float
+        # Convert numeric-looking strings to float; reject the rest without raising
         if isinstance(value, str):
-            float_val = float(value)
-            return not (np.isnan(float_val) or np.isinf(float_val))
+            return bool(_NUMERIC_RE.fullmatch(value)) and math.isfinite(float(value))
         
         # Check if it's a sympy number
         if hasattr(value, 'is_real') and hasattr(value, 'is_finite'):
@@ -42,6 +79,211 @@ def is_real_number(value: Any) -> bool:
         return False
 
 
+@lru_cache(maxsize=128)
+def cached_sympify(expression: str, *symbols: sp.Symbol) -> sp.Expr:
+    """
+    Parse a string into a SymPy expression, memoized per string and symbols.
+    
+    SymPy expressions are immutable, so the parsed tree can be shared by
+    every caller that receives the same string.
+    
+    Args:
+        expression: String representation of a mathematical function
+        symbols: Symbols bound to their names while parsing, e.g. a real x
+        
+    Returns:
+        The parsed SymPy expression
+        
+    Raises:
+        SympifyError: If the string cannot be parsed
+    """
+    return sp.sympify(expression, locals={str(symbol): symbol for symbol in symbols})
+
+
+def differentiate(expression: sp.Expr, var: sp.Symbol, order: int = 1) -> sp.Expr:
+    """
+    Differentiate a SymPy expression, in SymEngine's C++ core when it is installed.
+    
+    SymEngine symbols carry no assumptions, so the variable of the result is
+    swapped back for var (e.g. a real x). Expressions SymEngine cannot convert
+    are differentiated by SymPy, as are those whose SymEngine derivative
+    is left unevaluated.
+    
+    Args:
+        expression: SymPy expression to differentiate
+        var: The SymPy symbol of differentiation
+        order: The order of the derivative
+        
+    Returns:
+        The derivative as a SymPy expression
+    """
+    # Constant in var: nothing to differentiate
+    if order > 0 and var not in expression.free_symbols:
+        return sp.S.Zero
+    
+    if _se is not None:
+        try:
+            se_var = _se.Symbol(var.name)
+            derivative = _se.sympify(expression)
+            for _ in range(order):
+                derivative = derivative.diff(se_var)
+            derivative = sp.sympify(derivative).xreplace({sp.Symbol(var.name): var})
+            # SymEngine leaves e.g. Abs, sign and Max underived; SymPy handles those
+            if not derivative.has(sp.Derivative):
+                return derivative
+        except Exception:
+            pass
+    return sp.diff(expression, var, order)
+
+
+def horner_form(expression: sp.Expr, var: sp.Symbol) -> sp.Expr:
+    """
+    Rewrite a polynomial or rational function in nested (Horner) form for numeric evaluation.
+    
+    a*x**3 + b*x**2 + c becomes c + x**2*(b + a*x): fewer multiplications and
+    no general powers once lambdified. Rational functions get numerator and
+    denominator rewritten separately; anything else is returned unchanged.
+    
+    Args:
+        expression: SymPy expression in var (other symbols act as coefficients)
+        var: The SymPy symbol of the polynomial variable
+        
+    Returns:
+        The rewritten expression, or expression itself if it does not apply
+    """
+    try:
+        if expression.is_polynomial(var):
+            return sp.horner(expression, wrt=var)
+        if expression.is_rational_function(var):
+            numer, denom = sp.fraction(expression)
+            return sp.horner(numer, wrt=var) / sp.horner(denom, wrt=var)
+    except Exception:
+        pass
+    return expression
+
+
+def real_polynomial_roots(expression: sp.Expr, var: sp.Symbol) -> Optional[np.ndarray]:
+    """
+    Find the real roots of a polynomial with numeric coefficients using numpy.roots.
+    
+    Float coefficients (from substituted parameters) are rationalized first,
+    so repeated roots are removed exactly by taking the square-free part and
+    cannot drift apart or off the real axis. Each root is then snapped to
+    the rational it is an exact root at, if any, or polished by Newton
+    steps, so exact roots come out as exactly as solve() gives them.
+    
+    Args:
+        expression: SymPy expression to find roots of
+        var: The SymPy symbol of the polynomial variable
+        
+    Returns:
+        Sorted array of distinct real roots, or None if the expression is not such a polynomial
+    """
+    try:
+        poly = sp.Poly(expression, var)
+        coeffs = np.array([float(c) for c in poly.all_coeffs()])
+    except (sp.PolynomialError, TypeError, ValueError):
+        return None
+    
+    exact = None
+    if poly.degree() > 0:
+        try:
+            if not poly.domain.is_Exact:
+                poly = sp.Poly([sp.nsimplify(c, rational=True) for c in poly.all_coeffs()], var)
+            exact = poly.sqf_part()
+            coeffs = np.array([float(c) for c in exact.all_coeffs()])
+        except Exception:
+            exact = None
+    
+    roots = np.roots(coeffs)
+    tolerance = _IMAG_TOLERANCE * np.maximum(1.0, np.abs(roots))
+    real = np.sort(roots[np.abs(roots.imag) < tolerance].real)
+    if real.size == 0:
+        return real
+    
+    if exact is not None:
+        real = np.sort(np.array([_refine_root(exact, root) for root in real]))
+    
+    # Keep the first root of each cluster of (numerically) repeated roots
+    keep = np.concatenate(([True], np.diff(real) > _ROOT_MERGE_TOLERANCE))
+    return real[keep]
+
+
+def _refine_root(poly: sp.Poly, root: float) -> float:
+    """
+    Correct a numeric root of a square-free polynomial with rational coefficients.
+    
+    Args:
+        poly: The polynomial, exact
+        root: Approximate real root from numpy.roots
+        
+    Returns:
+        The root as a rational if it is exactly one, else after Newton steps
+        at extended precision, rounded to the nearest float
+    """
+    candidate = Fraction(root).limit_denominator(_SNAP_DENOMINATOR)
+    candidate = sp.Rational(candidate.numerator, candidate.denominator)
+    if abs(float(candidate) - root) <= _ROOT_MERGE_TOLERANCE * max(1.0, abs(root)) \
+            and poly.eval(candidate) == 0:
+        return float(candidate)
+    
+    with mpmath.workdps(_REFINE_DPS):
+        coeffs = [mpmath.mpf(c.p) / c.q for c in poly.all_coeffs()]
+        slopes = [c * n for c, n in zip(coeffs[:-1], range(len(coeffs) - 1, 0, -1))]
+        value = mpmath.mpf(root)
+        for _ in range(2):
+            slope = mpmath.polyval(slopes, value)
+            if slope == 0:
+                return root
+            value -= mpmath.polyval(coeffs, value) / slope
+        return float(value)
+
+
+@lru_cache(maxsize=256)
+def _substituted_expression(expression: str, param_items: Tuple[Tuple[str, float], ...]) -> sp.Expr:
+    """
+    Parse an expression and substitute parameter values, memoized per string and values.
+    
+    Args:
+        expression: String representation of a mathematical function
+        param_items: Sorted (name, value) pairs of the parameters
+        
+    Returns:
+        The parsed SymPy expression with the parameters replaced
+        
+    Raises:
+        SympifyError: If the string cannot be parsed
+    """
+    expr = cached_sympify(expression)
+    if param_items:
+        expr = expr.xreplace({sp.Symbol(name): sp.Float(value) for name, value in param_items})
+    return expr
+
+
+@lru_cache(maxsize=256)
+def _numeric_function(expression: str, param_items: Tuple[Tuple[str, float], ...]):
+    """
+    Compile an expression with its parameters substituted into a numeric callable of x.
+    
+    Polynomials with numeric coefficients are evaluated by numpy.polyval
+    (Horner's scheme in C); anything else is lambdified.
+    
+    Args:
+        expression: String representation of a mathematical function
+        param_items: Sorted (name, value) pairs of the parameters
+        
+    Returns:
+        The numeric function
+    """
+    x = sp.Symbol('x')
+    expr = _substituted_expression(expression, param_items)
+    try:
+        coeffs = [float(c) for c in sp.Poly(expr, x).all_coeffs()]
+        return partial(np.polyval, coeffs)
+    except (sp.PolynomialError, TypeError, ValueError):
+        return sp.lambdify(x, expr, modules=['numpy', 'math'])
+
+
 def evaluate_expression(expression: str, x_value: Union[int, float], params: Optional[Dict[str, Union[int, float]]] = None) -> Optional[float]:
     """
     Evaluate a mathematical expression at a given x value with optional parameters.
@@ -65,32 +307,29 @@ def evaluate_expression(expression: str, x_value: Union[int, float], params: Opt
         # Create sympy symbol for x
         x = sp.Symbol('x')
         
-        # Parse the expression
+        # Validate parameters; invalid names or values are left unsubstituted
+        param_items = tuple(sorted(
+            (param_name, float(param_value)) for param_name, param_value in (params or {}).items()
+            if isinstance(param_name, str) and is_real_number(param_value)
+        ))
+        
+        # Compiled numeric evaluation; anything it cannot handle falls through to SymPy
+        try:
+            with np.errstate(all='ignore'):
+                value = complex(_numeric_function(expression, param_items)(float(x_value)))
+            # Adding 0.0 turns IEEE negative zero into 0.0, as SymPy reports it
+            return value.real + 0.0 if value.imag == 0 and np.isfinite(value.real) else None
+        except Exception:
+            pass
+        
+        # Parse the expression and substitute the parameters (memoized)
         try:
-            expr = sp.sympify(expression)
+            expr = _substituted_expression(expression, param_items)
         except (sp.SympifyError, ValueError, TypeError):
             return None
         
-        # Substitute parameters if provided
-        if params:
-            try:
-                # Validate parameters
-                validated_params = {}
-                for param_name, param_value in params.items():
-                    if not isinstance(param_name, str):
-                        continue
-                    if not is_real_number(param_value):
-                        continue
-                    validated_params[sp.Symbol(param_name)] = float(param_value)
-                
-                if validated_params:
-                    expr = expr.subs(validated_params)
-            except (TypeError, ValueError, AttributeError):
-                # Continue without parameter substitution if it fails
-                pass
-        
         # Substitute x value
-        result = expr.subs(x, float(x_value))
+        result = expr.xreplace({x: sp.Float(x_value)})
         
         # Convert to float
         try:
@@ -116,83 +355,115 @@ def evaluate_expression(expression: str, x_value: Union[int, float], params: Opt
 
 # Additional utility functions for common mathematical operations
 
-def safe_log(value: Union[int, float], base: Union[int, float] = np.e) -> Optional[float]:
+def safe_log(value: Union[int, float, np.ndarray],
+             base: Union[int, float, np.ndarray] = np.e) -> Union[Optional[float], np.ndarray]:
     """
     Safely compute logarithm, returning None for invalid inputs.
     
+    Arrays are handled elementwise in one vectorized pass, with NaN where invalid.
+    
     Args:
-        value: The value to compute log of
+        value: The value (or array of values) to compute log of
         base: The logarithm base (default: natural log)
         
     Returns:
-        float: The logarithm result, or None if invalid
+        float: The logarithm result, or None if invalid; an array for array input
     """
-    try:
-        if not is_real_number(value) or not is_real_number(base):
-            return None
-        
-        if value <= 0 or base <= 0 or base == 1:
-            return None
-        
-        if base == np.e:
-            result = np.log(value)
-        else:
-            result = np.log(value) / np.log(base)
-        
-        return result if not (np.isnan(result) or np.isinf(result)) else None
+    if np.ndim(value) or np.ndim(base):
+        values, bases = np.asarray(value, dtype=float), np.asarray(base, dtype=float)
+        valid = (values > 0) & (bases > 0) & (bases != 1)
+        with np.errstate(all='ignore'):
+            result = np.log(np.where(valid, values, 1.0)) / np.log(np.where(valid, bases, np.e))
+        return np.where(valid & np.isfinite(result), result, np.nan)
     
-    except Exception:
+    if not is_real_number(value) or not is_real_number(base):
+        return None
+    
+    # Past the guards below, the math can no longer raise
+    try:
+        value, base = float(value), float(base)
+    except (OverflowError, TypeError, ValueError):
+        return None  # e.g. an int too large for a float
+    if value <= 0 or base <= 0 or base == 1:
         return None
+    
+    if base == math.e:
+        result = math.log(value)
+    else:
+        result = math.log(value) / math.log(base)
+    
+    return result if math.isfinite(result) else None
 
 
-def safe_sqrt(value: Union[int, float]) -> Optional[float]:
+def safe_sqrt(value: Union[int, float, np.ndarray]) -> Union[Optional[float], np.ndarray]:
     """
     Safely compute square root, returning None for negative values.
     
+    Arrays are handled elementwise in one vectorized pass, with NaN where invalid.
+    
     Args:
-        value: The value to compute square root of
+        value: The value (or array of values) to compute square root of
         
     Returns:
-        float: The square root result, or None if invalid
+        float: The square root result, or None if invalid; an array for array input
     """
-    try:
-        if not is_real_number(value):
-            return None
-        
-        if value < 0:
-            return None
-        
-        result = np.sqrt(value)
-        return result if not (np.isnan(result) or np.isinf(result)) else None
+    if np.ndim(value):
+        values = np.asarray(value, dtype=float)
+        valid = values >= 0
+        result = np.sqrt(np.where(valid, values, 0.0))
+        return np.where(valid & np.isfinite(result), result, np.nan)
     
-    except Exception:
+    if not is_real_number(value):
+        return None
+    
+    try:
+        value = float(value)
+    except (OverflowError, TypeError, ValueError):
+        return None  # e.g. an int too large for a float
+    if value < 0:
         return None
+    
+    return math.sqrt(value)
 
 
-def safe_power(base: Union[int, float], exponent: Union[int, float]) -> Optional[float]:
+def safe_power(base: Union[int, float, np.ndarray],
+               exponent: Union[int, float, np.ndarray]) -> Union[Optional[float], np.ndarray]:
     """
     Safely compute power operation, handling edge cases.
     
+    Arrays are handled elementwise in one vectorized pass, with NaN where invalid.
+    
     Args:
-        base: The base value
-        exponent: The exponent value
+        base: The base value (or array of values)
+        exponent: The exponent value (or array of values)
         
     Returns:
-        float: The power result, or None if invalid
+        float: The power result, or None if invalid; an array for array input
     """
-    try:
-        if not is_real_number(base) or not is_real_number(exponent):
-            return None
-        
-        # Handle special cases
-        if base == 0 and exponent < 0:
-            return None  # Division by zero
-        
-        if base < 0 and not isinstance(exponent, int) and exponent != int(exponent):
-            return None  # Complex result
-        
-        result = np.power(base, exponent)
-        return result if not (np.isnan(result) or np.isinf(result)) else None
+    if np.ndim(base) or np.ndim(exponent):
+        bases, exponents = np.asarray(base, dtype=float), np.asarray(exponent, dtype=float)
+        # Division by zero and complex results are invalid, as for scalars
+        valid = ~((bases == 0) & (exponents < 0)) & ~((bases < 0) & (exponents != np.trunc(exponents)))
+        with np.errstate(all='ignore'):
+            result = np.power(np.where(valid, bases, 1.0), exponents)
+        return np.where(valid & np.isfinite(result), result, np.nan)
     
-    except Exception:
+    if not is_real_number(base) or not is_real_number(exponent):
         return None
+    
+    try:
+        base, exponent = float(base), float(exponent)
+    except (OverflowError, TypeError, ValueError):
+        return None  # e.g. an int too large for a float
+    
+    # Handle special cases
+    if base == 0 and exponent < 0:
+        return None  # Division by zero
+    
+    if base < 0 and exponent != int(exponent):
+        return None  # Complex result
+    
+    # Overflow gives inf rather than raising
+    with np.errstate(over='ignore'):
+        result = np.power(base, exponent)
+    return float(result) if np.isfinite(result) else None
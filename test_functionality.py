@@ -0,0 +1,189 @@
+"""
+Regression tests for the numeric and symbolic helpers used by the analysis.
+
+Run with: python -m pytest test_functionality.py
+"""
+
+import numpy as np
+import sympy as sp
+
+from Utils.math_utils import (differentiate, is_real_number, real_polynomial_roots,
+                              safe_log, safe_power, safe_sqrt)
+
+x = sp.Symbol('x', real=True)
+
+
+def test_differentiate_matches_sympy():
+    """Derivatives agree with sp.diff, including those SymEngine leaves unevaluated."""
+    expressions = [
+        x**3 * sp.sin(x),
+        sp.exp(x) / (x**2 + 1),
+        sp.Abs(x),
+        sp.sign(x),
+        sp.Max(0, x),
+        sp.Piecewise((x**2, x > 0), (-x, True))
+    ]
+    for expression in expressions:
+        for order in (1, 2):
+            derivative = differentiate(expression, x, order)
+            assert not derivative.has(sp.Derivative)
+            assert sp.simplify(derivative - sp.diff(expression, x, order)) == 0
+
+
+def test_differentiate_keeps_real_symbol():
+    """The result is in the caller's (real) symbol, not a plain Symbol('x')."""
+    assert differentiate(x**2, x) == 2 * x
+    assert differentiate(x**2, x).free_symbols == {x}
+
+
+def test_differentiate_constant():
+    """An expression free of the variable differentiates to zero."""
+    a = sp.Symbol('a')
+    assert differentiate(a**2 + 3, x) == 0
+
+
+def test_real_polynomial_roots_exact_values():
+    """Rational roots come out exactly, as solve() gives them."""
+    assert real_polynomial_roots(x**4 - 4*x**2, x).tolist() == [-2.0, 0.0, 2.0]
+    assert real_polynomial_roots(x**2 - 4, x).tolist() == [-2.0, 2.0]
+    assert real_polynomial_roots((2*x - 1)**2 * (x + 3), x).tolist() == [-3.0, 0.5]
+
+
+def test_real_polynomial_roots_repeated_float_coefficients():
+    """A repeated root with float coefficients (substituted parameters) is found once, exactly."""
+    assert real_polynomial_roots(sp.Float(1.0) * (x - 1)**3, x).tolist() == [1.0]
+    assert real_polynomial_roots(sp.expand(sp.Float(2.5) * (x + 2)**2 * (x - 3)), x).tolist() == [-2.0, 3.0]
+
+
+def test_real_polynomial_roots_irrational():
+    """Irrational roots match the float of the exact root."""
+    roots = real_polynomial_roots(x**3 - 3*x, x).tolist()
+    assert roots == [float(-sp.sqrt(3)), 0.0, float(sp.sqrt(3))]
+    assert real_polynomial_roots(x**2 - 2, x).tolist() == [float(-sp.sqrt(2)), float(sp.sqrt(2))]
+
+
+def test_real_polynomial_roots_no_real_roots_and_non_polynomials():
+    """Complex roots are dropped; non-polynomials are not handled."""
+    assert real_polynomial_roots(x**2 + 1, x).size == 0
+    assert real_polynomial_roots(sp.sin(x), x) is None
+    assert real_polynomial_roots(sp.Symbol('a') * x, x) is None
+    assert np.allclose(real_polynomial_roots(x**5 - x - 1, x), [1.1673039782614187])
+
+
+def test_trivial_latex_expressions_only_integer_powers():
+    """Only single-digit integer powers skip SymPy; decimal exponents must not."""
+    from Interface.show_info import _TRIVIAL_EXPR_RE
+    
+    assert _TRIVIAL_EXPR_RE.fullmatch("2.5*x**3 + 1.5")
+    assert not _TRIVIAL_EXPR_RE.fullmatch("x**2.5")
+    assert not _TRIVIAL_EXPR_RE.fullmatch("2.5*x**3.25 + 1")
+    assert not _TRIVIAL_EXPR_RE.fullmatch("x**12")
+
+
+def test_safe_helpers_scalars():
+    """Valid inputs give floats; invalid ones give None instead of raising."""
+    assert safe_log(100, 10) == 2.0
+    assert safe_sqrt(9) == 3.0
+    assert safe_power(2, 10) == 1024.0
+    assert safe_log(0) is None
+    assert safe_log(5, 1) is None
+    assert safe_sqrt(-1) is None
+    assert safe_power(0, -1) is None
+    assert safe_power(-8, 1 / 3) is None
+    assert safe_log("abc") is None
+
+
+def test_safe_helpers_huge_ints():
+    """Ints too large for a float are invalid, not an OverflowError."""
+    assert safe_log(10**400) is None
+    assert safe_sqrt(10**400) is None
+    assert safe_power(10**400, 2) is None
+    assert safe_power(10.0, 400) is None
+
+
+def test_safe_helpers_arrays():
+    """Arrays are handled elementwise, with NaN where invalid."""
+    np.testing.assert_array_equal(safe_sqrt(np.array([4.0, -1.0])), [2.0, np.nan])
+    np.testing.assert_allclose(safe_log(np.array([1.0, np.e, 0.0])), [0.0, 1.0, np.nan])
+    np.testing.assert_array_equal(safe_power(np.array([2.0, 0.0, -8.0]), np.array([2.0, -1.0, 0.5])),
+                                  [4.0, np.nan, np.nan])
+
+
+def test_is_real_number():
+    """Finite reals of every accepted type pass; everything else is rejected."""
+    accepted = [1, 1.5, True, np.float64(2.0), "1e3", " -2.5 ", ".5", "3.", sp.Integer(2), sp.Rational(1, 3)]
+    rejected = [float("nan"), float("inf"), "abc", "1_000", "inf", "nan", "", sp.I, sp.oo, None, [1]]
+    for value in accepted:
+        assert is_real_number(value), value
+    for value in rejected:
+        assert not is_real_number(value), value
+
+
+def test_analysis_results():
+    """End-to-end results that must match the exact (solve-based) analysis."""
+    from Models.main_function import MainFunctionProcessor
+    
+    rational = MainFunctionProcessor("x/(x**2-4)").analyze_function()
+    assert rational['asymptotes']['vertical'] == [-2.0, 2.0]
+    assert rational['asymptotes']['horizontal'] == [0.0]
+    assert rational['intercepts']['x_intercepts'] == [0.0]
+    
+    cubic = MainFunctionProcessor("a*(x-1)**3", {'a': 1.0}).analyze_function()
+    assert cubic['intercepts']['x_intercepts'] == [1.0]
+    assert cubic['critical_points'] == [1.0]
+    
+    absolute = MainFunctionProcessor("abs(x)").analyze_function()
+    assert absolute['first_derivative'] == 'sign(x)'
+    assert absolute['second_derivative'] == '2*DiracDelta(x)'
+    
+    # Rational derivatives are solved through their numerator, with casus irreducibilis roots kept
+    quotient = MainFunctionProcessor("(2*x**3+1)/(x**2-1)").analyze_function()
+    cubic_roots = [float(root) for root in sp.Poly(x**3 - 3*x - 1, x).real_roots()]
+    assert quotient['critical_points'] == sorted(cubic_roots + [0.0])
+    
+    # Infinitely many critical points: none are reported rather than a truncated subset
+    assert MainFunctionProcessor("x**2*sin(x)").analyze_function()['critical_points'] == []
+
+
+def test_analysis_cache_returns_copies():
+    """Cached analyses are not shared between callers."""
+    from Models.main_function import MainFunctionProcessor
+    
+    first = MainFunctionProcessor("x**3-3*x").analyze_function()
+    first['critical_points'].append(99.0)
+    second = MainFunctionProcessor("x**3-3*x").analyze_function()
+    assert second['critical_points'] == [-1.0, 1.0]
+
+
+def test_plot_curve_breaks_at_poles():
+    """The drawn curve has a NaN between the branches of a pole, and none on continuous curves."""
+    from Interface import App
+    App._load_numeric_stack()
+    
+    xs = np.linspace(-10, 10, 1000, dtype=np.float32)
+    with np.errstate(divide='ignore'):
+        reciprocal = App._drawable_curve(1 / xs)
+    negative, positive = np.flatnonzero(xs < 0)[-1], np.flatnonzero(xs > 0)[0]
+    assert np.isnan(reciprocal[negative:positive + 1]).any()
+    assert np.isfinite(reciprocal[:negative]).all() and np.isfinite(reciprocal[positive + 1:]).all()
+    
+    assert np.isnan(App._drawable_curve(np.tan(xs))).sum() == 6
+    assert not np.isnan(App._drawable_curve(xs**3)).any()
+    assert np.isnan(App._drawable_curve(np.array([1.0, 2e4, 3.0])))[1]
+
+
+def test_evaluations_have_no_negative_zero():
+    """Numeric evaluation reports 0.0, never IEEE -0.0, as the SymPy path did."""
+    import math
+    from Models.main_function import MainFunctionProcessor
+    from Utils.math_utils import evaluate_expression
+    
+    def positive_zero(value):
+        return value == 0 and math.copysign(1.0, value) == 1.0
+    
+    for func_str in ("x/(x**2-4)", "x**2/(x-1)"):
+        results = MainFunctionProcessor(func_str).analyze_function()
+        assert positive_zero(results['sample_evaluations']['0'])
+        for values in (results['critical_points_values'], results['inflection_points_values']):
+            assert all(positive_zero(value) for value in values.values() if value == 0)
+        assert positive_zero(evaluate_expression(func_str, 0))
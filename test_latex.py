@@ -4,18 +4,20 @@ Test script for LaTeX rendering functionality.
 This script tests if LaTeX rendering works properly with matplotlib.
 """
 
-import matplotlib.pyplot as plt
 import sympy as sp
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter as tk
-from PIL import Image, ImageTk
-import io
+from sympy.printing.latex import LatexPrinter
+
+# One printer for every expression; sp.latex would build a new one per call
+latex = LatexPrinter().doprint
 
 def test_latex_rendering():
     """Test basic LaTeX rendering functionality."""
     
     # Test basic LaTeX rendering
     try:
+        # Imported here so the derivative test does not pay for matplotlib
+        import matplotlib.pyplot as plt
+        
         # Create a simple function
         x = sp.Symbol('x')
         func = x**2 + 2*x + 1
@@ -61,12 +63,12 @@ def test_derivatives_latex():
             
             # First derivative
             first_deriv = sp.diff(func, x)
-            latex_first = sp.latex(first_deriv)
+            latex_first = latex(first_deriv)
             print(f"First derivative LaTeX: f'(x) = {latex_first}")
             
             # Second derivative
             second_deriv = sp.diff(func, x, 2)
-            latex_second = sp.latex(second_deriv)
+            latex_second = latex(second_deriv)
             print(f"Second derivative LaTeX: f''(x) = {latex_second}")
         
         return True